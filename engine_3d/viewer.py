@@ -71,6 +71,14 @@ class CADViewer(QWidget):
         self.selected_shapes = set()
         self.shape_counter = 0
         
+        # Görüntülenmeyi bekleyen AIS nesneleri - aynı event loop turunda
+        # eklenen şekiller tek Display/Update geçişinde çizilir
+        self._pending_display = []
+        self._display_timer = QTimer(self)
+        self._display_timer.setSingleShot(True)
+        self._display_timer.setInterval(0)
+        self._display_timer.timeout.connect(self._flush_pending_display)
+        
         # Managers
         try:
             self.geometry_handler = GeometryHandler(config)
@@ -440,17 +448,9 @@ class CADViewer(QWidget):
             except:
                 pass
             
-            # KRITIK: Context'e ZORLAMA ile ekle
-            self._context.Display(ais_shape, True)  # True = Immediate update
-            
-            # ZORLAMA: Fit all
-            self._display.FitAll()
-            
-            # ZORLAMA: Repaint
-            self._display.Repaint()
-            
-            # ZORLAMA: Update viewer
-            self._context.UpdateCurrentViewer()
+            # Context'e ekleme toplu yapılır (bkz. _flush_pending_display)
+            self._pending_display.append(ais_shape)
+            self._display_timer.start()
             
             # Shape'i kaydet
             self.shapes[shape_id] = {
@@ -463,19 +463,50 @@ class CADViewer(QWidget):
                 "visible": True
             }
             
-            # ZORLAMA: Widget'ı yeniden boyutlandır
+            self.logger.info(f"Shape ZORLAMA ile eklendi: {shape_id}")
+            return shape_id
+            
+        except Exception as e:
+            self.logger.error(f"Shape display ZORLAMA hatası: {e}")
+            return None   
+    
+    def add_shapes_batch(self, shapes: List[Any], **kwargs) -> List[Optional[str]]:
+        """Birden fazla şekli ekle ve tek viewer güncellemesi ile çiz
+        
+        Args:
+            shapes: Eklenecek şekiller
+            **kwargs: add_shape parametreleri (color, transparency, ...)
+            
+        Returns:
+            Her şekil için shape_id (eklenemeyenler için None)
+        """
+        shape_ids = [self.add_shape(shape, **kwargs) for shape in shapes]
+        self._flush_pending_display()
+        return shape_ids
+    
+    def _flush_pending_display(self):
+        """Bekleyen şekilleri güncellemesiz göster, sonra bir kez güncelle"""
+        self._display_timer.stop()
+        if not self._pending_display:
+            return
+        
+        pending, self._pending_display = self._pending_display, []
+        try:
+            for ais_shape in pending:
+                self._context.Display(ais_shape, False)
+            
+            self._display.FitAll()
+            self._context.UpdateCurrentViewer()
+            
             try:
                 self._viewer_3d.update()
-                self._viewer_3d.repaint()
             except:
                 pass
             
-            self.logger.info(f"Shape ZORLAMA ile eklendi: {shape_id}")
-            return shape_id
+            self.logger.debug(f"{len(pending)} şekil tek güncelleme ile gösterildi")
             
         except Exception as e:
-            self.logger.error(f"Shape display ZORLAMA hatası: {e}")
-            return None   
+            self.logger.error(f"Toplu şekil gösterme hatası: {e}")
     
     def remove_shape(self, shape_id: str) -> bool:
         """Şekli sahneden kaldır"""
@@ -487,7 +518,11 @@ class CADViewer(QWidget):
             if OCC_AVAILABLE and self._context and self.shapes[shape_id]["ais_shape"]:
                 # AIS context'ten kaldır
                 ais_shape = self.shapes[shape_id]["ais_shape"]
-                self._context.Remove(ais_shape, True)
+                if ais_shape in self._pending_display:
+                    # Henüz gösterilmemiş - sadece kuyruktan çıkar
+                    self._pending_display.remove(ais_shape)
+                else:
+                    self._context.Remove(ais_shape, True)
             
             # Dictionary'den kaldır
             del self.shapes[shape_id]
@@ -625,6 +660,35 @@ class CADViewer(QWidget):
             self.logger.error(f"Şeffaflık değişiklik hatası: {e}")
             return False
     
+    def set_transparency_batch(self, ids: List[str], alpha: float) -> int:
+        """Birden çok şeklin şeffaflığını değiştir (tek viewer güncellemesi)"""
+        updated = 0
+        try:
+            use_context = OCC_AVAILABLE and self._context
+            
+            for shape_id in ids:
+                shape_data = self.shapes.get(shape_id)
+                if shape_data is None:
+                    continue
+                
+                ais_shape = shape_data["ais_shape"]
+                if use_context and ais_shape:
+                    if alpha > 0:
+                        self._context.SetTransparency(ais_shape, alpha, False)
+                    else:
+                        self._context.UnsetTransparency(ais_shape, False)
+                
+                shape_data["transparency"] = alpha
+                updated += 1
+            
+            if use_context and updated:
+                self._context.UpdateCurrentViewer()
+            
+        except Exception as e:
+            self.logger.error(f"Toplu şeffaflık değişiklik hatası: {e}")
+        
+        return updated
+    
     def cleanup(self):
         """Temizlik işlemleri"""
         try:
@@ -3,14 +3,65 @@ GUI Modülü
 PyQt5 tabanlı kullanıcı arayüzü bileşenleri
 """
 
-from .main_window import MainWindow, ImportWorker
-from .toolbar import MainToolbar, ViewToolbar, AssemblyToolbar, StatusToolbar
-from .dialogs import SettingsDialog, AboutDialog, FileInfoDialog, ProgressDialog, LogViewerDialog
-from .widgets import (
-    PropertyPanel, LogWidget, ProgressWidget, ShapeTreeWidget,
-    AssemblyConstraintWidget, GeometryInfoWidget, StatusInfoWidget,
-    ColorPickerWidget, MaterialPropertyWidget
-)
+import importlib.util
+import logging
+import os
+import re
+import sys
+
+_logger = logging.getLogger("CADMontaj.GUI")
+
+def _lazy(name):
+    """Alt modülü kaydet, kodunu ilk attribute erişimine kadar çalıştırma"""
+    if name in sys.modules:
+        return sys.modules[name]
+    
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+# Ağır alt modüller (OCC/Qt bağımlılıkları) ilk kullanımda çalıştırılır
+_main_window = _lazy(__name__ + ".main_window")
+_toolbar = _lazy(__name__ + ".toolbar")
+_dialogs = _lazy(__name__ + ".dialogs")
+_widgets = _lazy(__name__ + ".widgets")
+
+_LAZY_EXPORTS = {
+    'MainWindow': _main_window,
+    'ImportWorker': _main_window,
+    'MainToolbar': _toolbar,
+    'ViewToolbar': _toolbar,
+    'AssemblyToolbar': _toolbar,
+    'StatusToolbar': _toolbar,
+    'SettingsDialog': _dialogs,
+    'AboutDialog': _dialogs,
+    'FileInfoDialog': _dialogs,
+    'ProgressDialog': _dialogs,
+    'LogViewerDialog': _dialogs,
+    'PropertyPanel': _widgets,
+    'LogWidget': _widgets,
+    'ProgressWidget': _widgets,
+    'ShapeTreeWidget': _widgets,
+    'AssemblyConstraintWidget': _widgets,
+    'GeometryInfoWidget': _widgets,
+    'StatusInfoWidget': _widgets,
+    'ColorPickerWidget': _widgets,
+    'MaterialPropertyWidget': _widgets
+}
+
+def __getattr__(name):
+    """Export edilen sınıfları ilgili alt modülden çöz"""
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
 
 __version__ = "1.0.0"
 __author__ = "CAD Developer"
@@ -41,15 +92,28 @@ __all__ = [
 
 def create_main_window(config, logger):
     """Ana pencere oluştur"""
-    return MainWindow(config, logger)
+    return _main_window.MainWindow(config, logger)
 
 def create_settings_dialog(config, parent=None):
     """Ayarlar dialog'u oluştur"""
-    return SettingsDialog(config, parent)
+    return _dialogs.SettingsDialog(config, parent)
 
 def create_about_dialog(parent=None):
     """Hakkında dialog'u oluştur"""
-    return AboutDialog(parent)
+    return _dialogs.AboutDialog(parent)
+
+# Qt modülleri ilk kullanımda bir kez çözülür
+_QtWidgets = None
+_QtGui = None
+_QtCore = None
+
+def _qt():
+    """QtWidgets, QtGui ve QtCore modüllerini döndür"""
+    global _QtWidgets, _QtGui, _QtCore
+    if _QtWidgets is None:
+        from PyQt5 import QtWidgets, QtGui, QtCore
+        _QtWidgets, _QtGui, _QtCore = QtWidgets, QtGui, QtCore
+    return _QtWidgets, _QtGui, _QtCore
 
 # Modül seviyesinde yardımcı fonksiyonlar
 def check_gui_dependencies():
@@ -70,216 +134,228 @@ def get_qt_version():
     except:
         return "Bilinmeyen versiyon"
 
+def _minify_qss(qss):
+    """QSS metnindeki yorum ve boşlukları bir kez temizle"""
+    qss = re.sub(r"/\*.*?\*/", "", qss, flags=re.DOTALL)
+    return re.sub(r"\s+", " ", qss).strip()
+
+# Tema stilleri modül yüklenirken bir kez küçültülür
+_DARK_QSS = _minify_qss("""
+    QMainWindow {
+        background-color: #2b2b2b;
+        color: #ffffff;
+    }
+    QWidget {
+        background-color: #2b2b2b;
+        color: #ffffff;
+    }
+    QMenuBar {
+        background-color: #3c3c3c;
+        color: #ffffff;
+    }
+    QMenuBar::item {
+        background-color: #3c3c3c;
+        color: #ffffff;
+    }
+    QMenuBar::item:selected {
+        background-color: #5c5c5c;
+    }
+    QMenu {
+        background-color: #3c3c3c;
+        color: #ffffff;
+        border: 1px solid #5c5c5c;
+    }
+    QMenu::item:selected {
+        background-color: #5c5c5c;
+    }
+    QToolBar {
+        background-color: #3c3c3c;
+        border: 1px solid #5c5c5c;
+    }
+    QStatusBar {
+        background-color: #3c3c3c;
+        color: #ffffff;
+    }
+    QPushButton {
+        background-color: #4c4c4c;
+        border: 1px solid #6c6c6c;
+        padding: 5px;
+        color: #ffffff;
+    }
+    QPushButton:hover {
+        background-color: #5c5c5c;
+    }
+    QPushButton:pressed {
+        background-color: #3c3c3c;
+    }
+    QLineEdit, QTextEdit, QComboBox {
+        background-color: #4c4c4c;
+        border: 1px solid #6c6c6c;
+        color: #ffffff;
+        padding: 2px;
+    }
+    QTreeWidget, QListWidget, QTableWidget {
+        background-color: #3c3c3c;
+        alternate-background-color: #4c4c4c;
+        color: #ffffff;
+        border: 1px solid #6c6c6c;
+    }
+    QHeaderView::section {
+        background-color: #5c5c5c;
+        color: #ffffff;
+        padding: 4px;
+        border: 1px solid #6c6c6c;
+    }
+    QGroupBox {
+        border: 2px solid #6c6c6c;
+        margin: 5px;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+    }
+    QTabWidget::pane {
+        border: 1px solid #6c6c6c;
+    }
+    QTabBar::tab {
+        background-color: #4c4c4c;
+        color: #ffffff;
+        padding: 5px;
+        margin-right: 2px;
+    }
+    QTabBar::tab:selected {
+        background-color: #5c5c5c;
+    }
+    QSlider::groove:horizontal {
+        border: 1px solid #6c6c6c;
+        height: 8px;
+        background: #4c4c4c;
+        margin: 2px 0;
+    }
+    QSlider::handle:horizontal {
+        background: #8c8c8c;
+        border: 1px solid #6c6c6c;
+        width: 18px;
+        margin: -2px 0;
+        border-radius: 3px;
+    }
+    QProgressBar {
+        border: 1px solid #6c6c6c;
+        border-radius: 3px;
+        text-align: center;
+    }
+    QProgressBar::chunk {
+        background-color: #0078d4;
+        border-radius: 3px;
+    }
+    QCheckBox::indicator {
+        width: 13px;
+        height: 13px;
+    }
+    QCheckBox::indicator:unchecked {
+        background-color: #4c4c4c;
+        border: 1px solid #6c6c6c;
+    }
+    QCheckBox::indicator:checked {
+        background-color: #0078d4;
+        border: 1px solid #0078d4;
+    }
+""")
+
+_LIGHT_QSS = _minify_qss("""
+    QMainWindow {
+        background-color: #f0f0f0;
+    }
+    QToolBar {
+        border: 1px solid #c0c0c0;
+        background-color: #f8f8f8;
+    }
+    QStatusBar {
+        border-top: 1px solid #c0c0c0;
+    }
+    QPushButton {
+        padding: 5px 10px;
+        border: 1px solid #c0c0c0;
+        border-radius: 3px;
+        background-color: #ffffff;
+    }
+    QPushButton:hover {
+        background-color: #e8e8e8;
+    }
+    QPushButton:pressed {
+        background-color: #d0d0d0;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #c0c0c0;
+        border-radius: 5px;
+        margin: 5px;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+    }
+    QTreeWidget, QListWidget, QTableWidget {
+        border: 1px solid #c0c0c0;
+        alternate-background-color: #f8f8f8;
+    }
+    QHeaderView::section {
+        background-color: #e0e0e0;
+        padding: 4px;
+        border: 1px solid #c0c0c0;
+    }
+    QTabWidget::pane {
+        border: 1px solid #c0c0c0;
+    }
+    QTabBar::tab {
+        background-color: #e0e0e0;
+        padding: 5px 10px;
+        margin-right: 2px;
+        border: 1px solid #c0c0c0;
+        border-bottom-color: transparent;
+    }
+    QTabBar::tab:selected {
+        background-color: #ffffff;
+        border-bottom-color: transparent;
+    }
+    QProgressBar {
+        border: 1px solid #c0c0c0;
+        border-radius: 3px;
+        text-align: center;
+        background-color: #f0f0f0;
+    }
+    QProgressBar::chunk {
+        background-color: #0078d4;
+        border-radius: 3px;
+    }
+""")
+
 def setup_application_style(app, theme="light"):
     """Uygulama stilini ayarla"""
     try:
         if theme == "dark":
             # Koyu tema
-            app.setStyleSheet("""
-                QMainWindow {
-                    background-color: #2b2b2b;
-                    color: #ffffff;
-                }
-                QWidget {
-                    background-color: #2b2b2b;
-                    color: #ffffff;
-                }
-                QMenuBar {
-                    background-color: #3c3c3c;
-                    color: #ffffff;
-                }
-                QMenuBar::item {
-                    background-color: #3c3c3c;
-                    color: #ffffff;
-                }
-                QMenuBar::item:selected {
-                    background-color: #5c5c5c;
-                }
-                QMenu {
-                    background-color: #3c3c3c;
-                    color: #ffffff;
-                    border: 1px solid #5c5c5c;
-                }
-                QMenu::item:selected {
-                    background-color: #5c5c5c;
-                }
-                QToolBar {
-                    background-color: #3c3c3c;
-                    border: 1px solid #5c5c5c;
-                }
-                QStatusBar {
-                    background-color: #3c3c3c;
-                    color: #ffffff;
-                }
-                QPushButton {
-                    background-color: #4c4c4c;
-                    border: 1px solid #6c6c6c;
-                    padding: 5px;
-                    color: #ffffff;
-                }
-                QPushButton:hover {
-                    background-color: #5c5c5c;
-                }
-                QPushButton:pressed {
-                    background-color: #3c3c3c;
-                }
-                QLineEdit, QTextEdit, QComboBox {
-                    background-color: #4c4c4c;
-                    border: 1px solid #6c6c6c;
-                    color: #ffffff;
-                    padding: 2px;
-                }
-                QTreeWidget, QListWidget, QTableWidget {
-                    background-color: #3c3c3c;
-                    alternate-background-color: #4c4c4c;
-                    color: #ffffff;
-                    border: 1px solid #6c6c6c;
-                }
-                QHeaderView::section {
-                    background-color: #5c5c5c;
-                    color: #ffffff;
-                    padding: 4px;
-                    border: 1px solid #6c6c6c;
-                }
-                QGroupBox {
-                    border: 2px solid #6c6c6c;
-                    margin: 5px;
-                    padding-top: 10px;
-                }
-                QGroupBox::title {
-                    subcontrol-origin: margin;
-                    left: 10px;
-                    padding: 0 5px 0 5px;
-                }
-                QTabWidget::pane {
-                    border: 1px solid #6c6c6c;
-                }
-                QTabBar::tab {
-                    background-color: #4c4c4c;
-                    color: #ffffff;
-                    padding: 5px;
-                    margin-right: 2px;
-                }
-                QTabBar::tab:selected {
-                    background-color: #5c5c5c;
-                }
-                QSlider::groove:horizontal {
-                    border: 1px solid #6c6c6c;
-                    height: 8px;
-                    background: #4c4c4c;
-                    margin: 2px 0;
-                }
-                QSlider::handle:horizontal {
-                    background: #8c8c8c;
-                    border: 1px solid #6c6c6c;
-                    width: 18px;
-                    margin: -2px 0;
-                    border-radius: 3px;
-                }
-                QProgressBar {
-                    border: 1px solid #6c6c6c;
-                    border-radius: 3px;
-                    text-align: center;
-                }
-                QProgressBar::chunk {
-                    background-color: #0078d4;
-                    border-radius: 3px;
-                }
-                QCheckBox::indicator {
-                    width: 13px;
-                    height: 13px;
-                }
-                QCheckBox::indicator:unchecked {
-                    background-color: #4c4c4c;
-                    border: 1px solid #6c6c6c;
-                }
-                QCheckBox::indicator:checked {
-                    background-color: #0078d4;
-                    border: 1px solid #0078d4;
-                }
-            """)
+            app.setStyleSheet(_DARK_QSS)
         else:
             # Açık tema (varsayılan)
-            app.setStyleSheet("""
-                QMainWindow {
-                    background-color: #f0f0f0;
-                }
-                QToolBar {
-                    border: 1px solid #c0c0c0;
-                    background-color: #f8f8f8;
-                }
-                QStatusBar {
-                    border-top: 1px solid #c0c0c0;
-                }
-                QPushButton {
-                    padding: 5px 10px;
-                    border: 1px solid #c0c0c0;
-                    border-radius: 3px;
-                    background-color: #ffffff;
-                }
-                QPushButton:hover {
-                    background-color: #e8e8e8;
-                }
-                QPushButton:pressed {
-                    background-color: #d0d0d0;
-                }
-                QGroupBox {
-                    font-weight: bold;
-                    border: 2px solid #c0c0c0;
-                    border-radius: 5px;
-                    margin: 5px;
-                    padding-top: 10px;
-                }
-                QGroupBox::title {
-                    subcontrol-origin: margin;
-                    left: 10px;
-                    padding: 0 5px 0 5px;
-                }
-                QTreeWidget, QListWidget, QTableWidget {
-                    border: 1px solid #c0c0c0;
-                    alternate-background-color: #f8f8f8;
-                }
-                QHeaderView::section {
-                    background-color: #e0e0e0;
-                    padding: 4px;
-                    border: 1px solid #c0c0c0;
-                }
-                QTabWidget::pane {
-                    border: 1px solid #c0c0c0;
-                }
-                QTabBar::tab {
-                    background-color: #e0e0e0;
-                    padding: 5px 10px;
-                    margin-right: 2px;
-                    border: 1px solid #c0c0c0;
-                    border-bottom-color: transparent;
-                }
-                QTabBar::tab:selected {
-                    background-color: #ffffff;
-                    border-bottom-color: transparent;
-                }
-                QProgressBar {
-                    border: 1px solid #c0c0c0;
-                    border-radius: 3px;
-                    text-align: center;
-                    background-color: #f0f0f0;
-                }
-                QProgressBar::chunk {
-                    background-color: #0078d4;
-                    border-radius: 3px;
-                }
-            """)
+            app.setStyleSheet(_LIGHT_QSS)
             
         return True
         
     except Exception as e:
-        logging.warning(f"Stil ayarlama hatası: {e}")
+        _logger.warning("Stil ayarlama hatası: %s", e)
         return False
 
 def apply_widget_theme(widget, theme="light"):
     """Tek bir widget'a tema uygula"""
     try:
         if theme == "dark":
+            QtWidgets, QtGui, QtCore = _qt()
+            QColor = QtGui.QColor
             palette = widget.palette()
             palette.setColor(widget.palette().Window, QColor(43, 43, 43))
             palette.setColor(widget.palette().WindowText, QColor(255, 255, 255))
@@ -297,7 +373,7 @@ def apply_widget_theme(widget, theme="light"):
             widget.setPalette(palette)
             
     except Exception as e:
-        logging.warning(f"Widget tema uygulama hatası: {e}")
+        _logger.warning("Widget tema uygulama hatası: %s", e)
 
 # GUI event handling utilities
 def center_widget_on_parent(widget, parent):
@@ -312,29 +388,31 @@ def center_widget_on_parent(widget, parent):
             
             widget.move(x, y)
     except Exception as e:
-        logging.warning(f"Widget ortalama hatası: {e}")
+        _logger.warning("Widget ortalama hatası: %s", e)
 
 def setup_window_icon(window, icon_path=None):
     """Pencere ikonunu ayarla"""
     try:
-        from PyQt5.QtGui import QIcon
+        QtWidgets, QtGui, QtCore = _qt()
         
         if icon_path and os.path.exists(icon_path):
-            window.setWindowIcon(QIcon(icon_path))
+            window.setWindowIcon(QtGui.QIcon(icon_path))
         else:
-            # Varsayılan sistem ikonu kullan
-            style = window.style()
-            icon = style.standardIcon(style.SP_ComputerIcon)
+            # Varsayılan sistem ikonu kullan (önce işletim sistemi teması)
+            icon = QtGui.QIcon.fromTheme("computer")
+            if icon.isNull():
+                style = window.style()
+                icon = style.standardIcon(style.SP_ComputerIcon)
             window.setWindowIcon(icon)
             
     except Exception as e:
-        logging.warning(f"İkon ayarlama hatası: {e}")
+        _logger.warning("İkon ayarlama hatası: %s", e)
 
 def create_separator_line(orientation="horizontal"):
     """Ayırıcı çizgi oluştur"""
     try:
-        from PyQt5.QtWidgets import QFrame
-        from PyQt5.QtCore import Qt
+        QtWidgets, QtGui, QtCore = _qt()
+        QFrame = QtWidgets.QFrame
         
         line = QFrame()
         if orientation.lower() == "horizontal":
@@ -346,23 +424,22 @@ def create_separator_line(orientation="horizontal"):
         return line
         
     except Exception as e:
-        logging.error(f"Ayırıcı çizgi oluşturma hatası: {e}")
+        _logger.error("Ayırıcı çizgi oluşturma hatası: %s", e)
         return None
 
 def show_loading_cursor():
     """Loading cursor göster"""
     try:
-        from PyQt5.QtWidgets import QApplication
-        from PyQt5.QtCore import Qt
-        QApplication.setOverrideCursor(Qt.WaitCursor)
+        QtWidgets, QtGui, QtCore = _qt()
+        QtWidgets.QApplication.setOverrideCursor(QtCore.Qt.WaitCursor)
     except:
         pass
 
 def restore_cursor():
     """Normal cursor'a geri dön"""
     try:
-        from PyQt5.QtWidgets import QApplication
-        QApplication.restoreOverrideCursor()
+        QtWidgets, QtGui, QtCore = _qt()
+        QtWidgets.QApplication.restoreOverrideCursor()
     except:
         pass
 
@@ -374,10 +451,5 @@ def initialize_gui():
         raise ImportError(f"GUI modülü başlatılamadı: {message}")
     
     qt_version = get_qt_version()
-    logging.info(f"GUI modülü başlatıldı - Qt {qt_version}")
+    _logger.info("GUI modülü başlatıldı - Qt %s", qt_version)
     return True
-
-# Import gerekli modüller
-import logging
-import os
-from PyQt5.QtGui import QColor
\ No newline at end of file
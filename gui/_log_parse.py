@@ -0,0 +1,49 @@
+"""
+Log Ayrıştırma
+Log görüntüleyici için satır indeksleme ve seviye sınıflandırma.
+Qt'den bağımsızdır; satır başına çalışan sıcak döngü bu modülde toplanır.
+"""
+
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+
+_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+# Log seviyesi: "[ERROR] ..." önekinden veya "tarih - logger - ERROR - ..." alanından
+_LEVEL_BY_PREFIX = {b"[%s]" % level.encode("ascii"): level for level in _LEVELS}
+_LEVEL_BY_FIELD = {level.encode("ascii"): level for level in _LEVELS}
+
+def scan_line_starts(buf, start: int = 0) -> np.ndarray:
+    """buf[start:] içindeki satır başlangıç offset'lerini vektörel tarama ile bul"""
+    if start >= len(buf):
+        return np.empty(0, dtype=np.int64)
+    data = np.frombuffer(buf, dtype=np.uint8, offset=start)
+    return np.flatnonzero(data == 0x0A) + (start + 1)
+
+def line_spans(line_starts: np.ndarray, size: int, limit: int):
+    """Son `limit` satırın (başlangıç, bitiş) byte aralıklarını çıkar"""
+    if len(line_starts) and line_starts[-1] >= size:
+        line_starts = line_starts[:-1]  # dosya sonundaki boş satır
+    starts = line_starts[-limit:]
+    ends = np.append(starts[1:] - 1, size)
+    return list(zip(starts.tolist(), ends.tolist()))
+
+def classify_line(line: bytes) -> Optional[str]:
+    """Log satırının seviyesini bul (regex yerine find + dict araması)"""
+    if line.startswith(b"["):
+        end = line.find(b"]", 1)
+        return _LEVEL_BY_PREFIX.get(line[:end + 1]) if end > 0 else None
+    
+    fields = line.split(b" - ", 3)
+    return _LEVEL_BY_FIELD.get(fields[2]) if len(fields) > 3 else None
+
+def iter_rows(buf, spans, level: Optional[str] = None) -> Iterator[Tuple[int, int, Optional[str]]]:
+    """Satır aralıklarından tembel olarak (başlangıç, bitiş, seviye) satırları üret
+    
+    Devam satırları (traceback vb.) önceki kaydın seviyesini alır;
+    `level` ilk satırlar için önceki kaydın seviyesidir.
+    """
+    for start, end in spans:
+        level = classify_line(buf[start:end]) or level
+        yield start, end, level
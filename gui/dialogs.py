@@ -3,9 +3,15 @@ Dialog Pencereleri - Import hataları düzeltildi
 Ayarlar, hakkında, dosya bilgileri vb. dialog pencereleri
 """
 
+import collections
+import functools
+import itertools
 import logging
+import mmap
 import os
 from typing import Dict, Any, Optional
+
+import numpy as np
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QGridLayout, QFormLayout,
     QLabel, QLineEdit, QPushButton, QTextEdit, QTabWidget,
@@ -13,25 +19,157 @@ from PyQt5.QtWidgets import (
     QSlider, QDialogButtonBox, QFileDialog, QMessageBox,
     QTreeWidget, QTreeWidgetItem, QSplitter, QFrame,
     QScrollArea, QWidget, QProgressDialog, QListWidget,
-    QProgressBar  
+    QProgressBar, QPlainTextEdit, QListView
+)
+from PyQt5.QtCore import (
+    Qt, pyqtSignal, pyqtSlot, QThread, QTimer, QAbstractListModel, QModelIndex
 )
-from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QThread, QTimer  
-from PyQt5.QtGui import QFont, QPixmap, QIcon
+from PyQt5.QtGui import QFont, QPixmap, QIcon, QColor, QBrush
 
 from utils import Config, APP_NAME, APP_VERSION, GUIDefaults
+from ._log_parse import scan_line_starts, line_spans, iter_rows
+
+_logger = logging.getLogger("CADMontaj.Dialogs")
+_settings_logger = logging.getLogger("CADMontaj.SettingsDialog")
+
+# Sabit dialog metinleri (modül yüklenirken bir kez oluşturulur)
+_APP_INFO_HTML = f"""
+<h2>{APP_NAME}</h2>
+<p><b>Versiyon:</b> {APP_VERSION}</p>
+<p><b>Geliştirici:</b> CAD Developer</p>
+<p><b>Açıklama:</b> STEP dosyalarının montajı için CAD uygulaması</p>
+"""
+
+_TECH_INFO_HTML = """
+<h3>Kullanılan Teknolojiler:</h3>
+<ul>
+<li>Python 3.x</li>
+<li>PyQt5</li>
+<li>PythonOCC Core 7.7.2</li>
+<li>OpenCASCADE</li>
+</ul>
+"""
+
+_CENTER_FMT = "(%.2f, %.2f, %.2f)"
+
+# Ayarlar dialog'u seçenek listeleri
+_THEMES = ("light", "dark")
+_LANGUAGES = ("tr", "en")
+_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_MATERIALS = ("plastic", "metal", "glass", "rubber")
+_IMPORT_UNITS = ("mm", "cm", "m", "in", "ft")
+
+# Geometri tab'ı grupları: (başlık, analiz bölümü, alanlar)
+_GEOM_GROUPS = (
+    ("Topology", "topology", ("num_solids", "num_faces", "num_edges", "num_vertices")),
+    ("Özellikler", "properties", ("volume", "surface_area", "center_of_mass")),
+    ("Bounding Box", "bounding_box", ("width", "height", "depth", "center"))
+)
+_CENTER_ITEMS = frozenset(("center_of_mass", "center"))
+
+_APP_ICON_PATH = os.path.join("resources", "icons", "app_icon.png")
+
+@functools.lru_cache(maxsize=None)
+def _pixmap(path: str, size: int) -> QPixmap:
+    """Ölçeklenmiş pixmap'i bir kez oluştur, sonraki açılışlarda tekrar kullan"""
+    return QPixmap(path).scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+# Log görüntüleyicide tutulacak maksimum satır sayısı
+_MAXIMUM_BLOCK_COUNT = 5000
+# Bu boyutun altındaki log dosyaları mmap yerine doğrudan okunur
+_MMAP_THRESHOLD = 1024 * 1024
+
+# Log dosyası bulunamadığında gösterilen örnek satırlar
+_SAMPLE_LOGS = (
+    "[INFO] Uygulama başlatıldı",
+    "[DEBUG] Viewer oluşturuldu",
+    "[INFO] Dosya yüklendi: example.step",
+    "[WARNING] Geometri healing uygulandı",
+    "[ERROR] Montaj başarısız: uygun bağlantı bulunamadı"
+)
+_SAMPLE_LOG_BYTES = "\n".join(_SAMPLE_LOGS).encode("utf-8")
+
+_IMPORT_SUCCESS_TEXT = "✓ Başarılı"
+_IMPORT_FAILED_TEXT = "✗ Başarısız"
+
+def _add_rows(layout: QFormLayout, rows):
+    """Form layout'a (etiket, widget) veya (widget,) satırlarını ekle"""
+    for row in rows:
+        layout.addRow(*row)
 
 class SettingsDialog(QDialog):
     """Ayarlar dialog penceresi"""
     
+    # tab index -> (widget attribute, config key, default, kind, scale)
+    _SETTING_BINDINGS = {
+        0: (
+            ("theme_combo", "gui.theme", "light", "text", None),
+            ("language_combo", "gui.language", "tr", "text", None),
+            ("window_maximized_check", "gui.window_maximized", False, "check", None),
+            ("default_dir_edit", "import.default_directory", "", "line", None),
+            ("max_recent_files_spin", "files.max_recent_files", 10, "value", None),
+            ("auto_backup_check", "files.auto_backup", True, "check", None),
+            ("log_level_combo", "logging.level", "INFO", "text", None),
+            ("file_logging_check", "logging.file_logging", True, "check", None),
+            ("max_log_files_spin", "logging.max_log_files", 5, "value", None)
+        ),
+        1: (
+            ("background_gradient_check", "viewer.background_gradient", True, "check", None),
+            ("antialiasing_check", "viewer.antialiasing", True, "check", None),
+            ("shadows_check", "viewer.shadows", True, "check", None),
+            ("mouse_sensitivity_slider", "viewer.mouse_sensitivity", 1.0, "slider", 50.0),
+            ("default_material_combo", "viewer.default_material", "plastic", "text", None),
+            ("transparency_slider", "display.transparency", 0.0, "slider", 100.0)
+        ),
+        2: (
+            ("healing_shapes_check", "import.healing_shapes", True, "check", None),
+            ("auto_fit_all_check", "import.auto_fit_all", True, "check", None),
+            ("import_units_combo", "import.import_units", "mm", "text", None),
+            ("content_check_enabled", "import.check_file_content", True, "check", None)
+        ),
+        3: (
+            ("tolerance_spin", "assembly.tolerance", 0.01, "value", None),
+            ("auto_collision_check", "assembly.auto_collision_check", True, "check", None),
+            ("show_constraints_check", "assembly.show_assembly_constraints", True, "check", None),
+            ("highlight_connections_check", "assembly.highlight_connections", True, "check", None),
+            ("connection_tolerance_spin", "assembly.connection_tolerance", 0.1, "value", None),
+            ("max_search_iterations_spin", "assembly.max_search_iterations", 100, "value", None)
+        ),
+        4: (
+            ("max_triangles_spin", "performance.max_triangles", 100000, "value", None),
+            ("tessellation_quality_slider", "performance.tessellation_quality", 0.5, "slider", 100.0),
+            ("use_mesh_cache_check", "performance.use_mesh_cache", True, "check", None),
+            ("parallel_processing_check", "performance.parallel_processing", True, "check", None),
+            ("memory_limit_spin", "performance.memory_limit_mb", 2048, "value", None)
+        )
+    }
+    
+    # Widget türüne göre değer yazma / okuma
+    _APPLY = {
+        "text": lambda widget, value, scale: widget.setCurrentText(value),
+        "line": lambda widget, value, scale: widget.setText(value),
+        "check": lambda widget, value, scale: widget.setChecked(value),
+        "value": lambda widget, value, scale: widget.setValue(value),
+        "slider": lambda widget, value, scale: widget.setValue(int(value * scale))
+    }
+    _READ = {
+        "text": lambda widget, scale: widget.currentText(),
+        "line": lambda widget, scale: widget.text(),
+        "check": lambda widget, scale: widget.isChecked(),
+        "value": lambda widget, scale: widget.value(),
+        "slider": lambda widget, scale: widget.value() / scale
+    }
+    
     def __init__(self, config: Config, parent=None):
         super().__init__(parent)
         
         self.config = config
-        self.logger = logging.getLogger("CADMontaj.SettingsDialog")
+        self.logger = _settings_logger
         self.original_settings = config.get_all_settings()
+        self._built = False
+        self._dir_dialog = None
         
         self._setup_ui()
-        self._load_settings()
         
         self.logger.debug("Ayarlar dialog'u oluşturuldu")
     
@@ -47,12 +185,20 @@ class SettingsDialog(QDialog):
         self.tab_widget = QTabWidget()
         layout.addWidget(self.tab_widget)
         
-        # Tab'ları oluştur
-        self._create_general_tab()
-        self._create_viewer_tab()
-        self._create_import_tab()
-        self._create_assembly_tab()
-        self._create_performance_tab()
+        # Tab'lar ilk seçildiklerinde oluşturulur, şimdilik boş yer tutucular
+        self._tab_builders = {
+            0: ("Genel", self._create_general_tab),
+            1: ("3D Viewer", self._create_viewer_tab),
+            2: ("İçe Aktarma", self._create_import_tab),
+            3: ("Montaj", self._create_assembly_tab),
+            4: ("Performans", self._create_performance_tab)
+        }
+        self._built_tabs = []
+        
+        for index in sorted(self._tab_builders):
+            self.tab_widget.addTab(QWidget(), self._tab_builders[index][0])
+        
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
         
         # Dialog butonları
         button_box = QDialogButtonBox(
@@ -64,31 +210,31 @@ class SettingsDialog(QDialog):
         
         layout.addWidget(button_box)
     
-    def _create_general_tab(self):
+    def _create_general_tab(self) -> QWidget:
         """Genel ayarlar tab'ı"""
         tab = QWidget()
         layout = QVBoxLayout(tab)
         
         # GUI Ayarları
         gui_group = QGroupBox("GUI Ayarları")
-        gui_layout = QFormLayout(gui_group)
         
         self.theme_combo = QComboBox()
-        self.theme_combo.addItems(["light", "dark"])
-        gui_layout.addRow("Tema:", self.theme_combo)
+        self.theme_combo.addItems(_THEMES)
         
         self.language_combo = QComboBox()
-        self.language_combo.addItems(["tr", "en"])
-        gui_layout.addRow("Dil:", self.language_combo)
+        self.language_combo.addItems(_LANGUAGES)
         
         self.window_maximized_check = QCheckBox("Başlangıçta tam ekran")
-        gui_layout.addRow(self.window_maximized_check)
         
+        _add_rows(QFormLayout(gui_group), (
+            ("Tema:", self.theme_combo),
+            ("Dil:", self.language_combo),
+            (self.window_maximized_check,)
+        ))
         layout.addWidget(gui_group)
         
         # Dosya Ayarları
         file_group = QGroupBox("Dosya Ayarları")
-        file_layout = QFormLayout(file_group)
         
         self.default_dir_edit = QLineEdit()
         default_dir_btn = QPushButton("Gözat...")
@@ -97,340 +243,352 @@ class SettingsDialog(QDialog):
         dir_layout = QHBoxLayout()
         dir_layout.addWidget(self.default_dir_edit)
         dir_layout.addWidget(default_dir_btn)
-        file_layout.addRow("Varsayılan Dizin:", dir_layout)
         
         self.max_recent_files_spin = QSpinBox()
         self.max_recent_files_spin.setRange(1, 20)
-        file_layout.addRow("Son Dosya Sayısı:", self.max_recent_files_spin)
         
         self.auto_backup_check = QCheckBox("Otomatik yedekleme")
-        file_layout.addRow(self.auto_backup_check)
         
+        _add_rows(QFormLayout(file_group), (
+            ("Varsayılan Dizin:", dir_layout),
+            ("Son Dosya Sayısı:", self.max_recent_files_spin),
+            (self.auto_backup_check,)
+        ))
         layout.addWidget(file_group)
         
         # Log Ayarları
         log_group = QGroupBox("Log Ayarları")
-        log_layout = QFormLayout(log_group)
         
         self.log_level_combo = QComboBox()
-        self.log_level_combo.addItems(["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"])
-        log_layout.addRow("Log Seviyesi:", self.log_level_combo)
+        self.log_level_combo.addItems(_LOG_LEVELS)
         
         self.file_logging_check = QCheckBox("Dosyaya log kaydet")
-        log_layout.addRow(self.file_logging_check)
         
         self.max_log_files_spin = QSpinBox()
         self.max_log_files_spin.setRange(1, 10)
-        log_layout.addRow("Maksimum Log Dosyası:", self.max_log_files_spin)
         
+        _add_rows(QFormLayout(log_group), (
+            ("Log Seviyesi:", self.log_level_combo),
+            (self.file_logging_check,),
+            ("Maksimum Log Dosyası:", self.max_log_files_spin)
+        ))
         layout.addWidget(log_group)
         layout.addStretch()
         
-        self.tab_widget.addTab(tab, "Genel")
+        return tab
     
-    def _create_viewer_tab(self):
+    def _create_viewer_tab(self) -> QWidget:
         """3D Viewer ayarları tab'ı"""
         tab = QWidget()
         layout = QVBoxLayout(tab)
         
         # Görünüm Ayarları
         view_group = QGroupBox("Görünüm Ayarları")
-        view_layout = QFormLayout(view_group)
-        
-        self.background_gradient_check = QCheckBox("Gradient arkaplan")
-        view_layout.addRow(self.background_gradient_check)
-        
-        self.antialiasing_check = QCheckBox("Antialiasing")
-        view_layout.addRow(self.antialiasing_check)
         
-        self.shadows_check = QCheckBox("Gölgeler")
-        view_layout.addRow(self.shadows_check)
+        self.background_gradient_check, self.antialiasing_check, self.shadows_check = [
+            QCheckBox(text) for text in ("Gradient arkaplan", "Antialiasing", "Gölgeler")
+        ]
         
         self.mouse_sensitivity_slider = QSlider(Qt.Horizontal)
         self.mouse_sensitivity_slider.setRange(1, 100)
+        self.mouse_sensitivity_slider.setTracking(False)  # etiket sadece bırakınca güncellenir
         self.mouse_sensitivity_label = QLabel("1.0")
         
         sensitivity_layout = QHBoxLayout()
         sensitivity_layout.addWidget(self.mouse_sensitivity_slider)
         sensitivity_layout.addWidget(self.mouse_sensitivity_label)
-        view_layout.addRow("Mouse Hassasiyeti:", sensitivity_layout)
         
-        self.mouse_sensitivity_slider.valueChanged.connect(
-            lambda v: self.mouse_sensitivity_label.setText(f"{v/50.0:.1f}")
-        )
+        self.mouse_sensitivity_slider.valueChanged.connect(self._on_mouse_sensitivity_changed)
         
+        _add_rows(QFormLayout(view_group), (
+            (self.background_gradient_check,),
+            (self.antialiasing_check,),
+            (self.shadows_check,),
+            ("Mouse Hassasiyeti:", sensitivity_layout)
+        ))
         layout.addWidget(view_group)
         
         # Malzeme Ayarları
         material_group = QGroupBox("Malzeme Ayarları")
-        material_layout = QFormLayout(material_group)
         
         self.default_material_combo = QComboBox()
-        self.default_material_combo.addItems(["plastic", "metal", "glass", "rubber"])
-        material_layout.addRow("Varsayılan Malzeme:", self.default_material_combo)
+        self.default_material_combo.addItems(_MATERIALS)
         
         self.transparency_slider = QSlider(Qt.Horizontal)
         self.transparency_slider.setRange(0, 100)
+        self.transparency_slider.setTracking(False)  # etiket sadece bırakınca güncellenir
         self.transparency_label = QLabel("0%")
         
         trans_layout = QHBoxLayout()
         trans_layout.addWidget(self.transparency_slider)
         trans_layout.addWidget(self.transparency_label)
-        material_layout.addRow("Varsayılan Şeffaflık:", trans_layout)
         
-        self.transparency_slider.valueChanged.connect(
-            lambda v: self.transparency_label.setText(f"{v}%")
-        )
+        self.transparency_slider.valueChanged.connect(self._on_transparency_changed)
         
+        _add_rows(QFormLayout(material_group), (
+            ("Varsayılan Malzeme:", self.default_material_combo),
+            ("Varsayılan Şeffaflık:", trans_layout)
+        ))
         layout.addWidget(material_group)
         layout.addStretch()
         
-        self.tab_widget.addTab(tab, "3D Viewer")
+        return tab
     
-    def _create_import_tab(self):
+    def _create_import_tab(self) -> QWidget:
         """İçe aktarma ayarları tab'ı"""
         tab = QWidget()
         layout = QVBoxLayout(tab)
         
         # İmport Ayarları
         import_group = QGroupBox("İçe Aktarma Ayarları")
-        import_layout = QFormLayout(import_group)
         
-        self.healing_shapes_check = QCheckBox("Shape healing uygula")
-        import_layout.addRow(self.healing_shapes_check)
-        
-        self.auto_fit_all_check = QCheckBox("Otomatik fit all")
-        import_layout.addRow(self.auto_fit_all_check)
+        self.healing_shapes_check, self.auto_fit_all_check = [
+            QCheckBox(text) for text in ("Shape healing uygula", "Otomatik fit all")
+        ]
         
         self.import_units_combo = QComboBox()
-        self.import_units_combo.addItems(["mm", "cm", "m", "in", "ft"])
-        import_layout.addRow("İçe Aktarma Birimi:", self.import_units_combo)
+        self.import_units_combo.addItems(_IMPORT_UNITS)
         
+        _add_rows(QFormLayout(import_group), (
+            (self.healing_shapes_check,),
+            (self.auto_fit_all_check,),
+            ("İçe Aktarma Birimi:", self.import_units_combo)
+        ))
         layout.addWidget(import_group)
         
         # Validasyon Ayarları
         validation_group = QGroupBox("Dosya Doğrulama")
-        validation_layout = QFormLayout(validation_group)
         
         self.max_file_size_spin = QSpinBox()
         self.max_file_size_spin.setRange(1, 2000)
         self.max_file_size_spin.setSuffix(" MB")
-        validation_layout.addRow("Maksimum Dosya Boyutu:", self.max_file_size_spin)
         
         self.content_check_enabled = QCheckBox("İçerik kontrolü")
-        validation_layout.addRow(self.content_check_enabled)
         
+        _add_rows(QFormLayout(validation_group), (
+            ("Maksimum Dosya Boyutu:", self.max_file_size_spin),
+            (self.content_check_enabled,)
+        ))
         layout.addWidget(validation_group)
         layout.addStretch()
         
-        self.tab_widget.addTab(tab, "İçe Aktarma")
+        return tab
     
-    def _create_assembly_tab(self):
+    def _create_assembly_tab(self) -> QWidget:
         """Montaj ayarları tab'ı"""
         tab = QWidget()
         layout = QVBoxLayout(tab)
         
         # Montaj Ayarları
         assembly_group = QGroupBox("Montaj Ayarları")
-        assembly_layout = QFormLayout(assembly_group)
         
         self.tolerance_spin = QDoubleSpinBox()
         self.tolerance_spin.setRange(0.001, 10.0)
         self.tolerance_spin.setDecimals(3)
         self.tolerance_spin.setSuffix(" mm")
-        assembly_layout.addRow("Tolerans:", self.tolerance_spin)
         
-        self.auto_collision_check = QCheckBox("Otomatik çakışma kontrolü")
-        assembly_layout.addRow(self.auto_collision_check)
-        
-        self.show_constraints_check = QCheckBox("Kısıtlamaları göster")
-        assembly_layout.addRow(self.show_constraints_check)
-        
-        self.highlight_connections_check = QCheckBox("Bağlantıları vurgula")
-        assembly_layout.addRow(self.highlight_connections_check)
+        self.auto_collision_check, self.show_constraints_check, self.highlight_connections_check = [
+            QCheckBox(text) for text in ("Otomatik çakışma kontrolü", "Kısıtlamaları göster", "Bağlantıları vurgula")
+        ]
         
         self.connection_tolerance_spin = QDoubleSpinBox()
         self.connection_tolerance_spin.setRange(0.01, 1.0)
         self.connection_tolerance_spin.setDecimals(2)
         self.connection_tolerance_spin.setSuffix(" mm")
-        assembly_layout.addRow("Bağlantı Toleransı:", self.connection_tolerance_spin)
         
         self.max_search_iterations_spin = QSpinBox()
         self.max_search_iterations_spin.setRange(10, 1000)
-        assembly_layout.addRow("Maksimum Arama İterasyonu:", self.max_search_iterations_spin)
         
+        _add_rows(QFormLayout(assembly_group), (
+            ("Tolerans:", self.tolerance_spin),
+            (self.auto_collision_check,),
+            (self.show_constraints_check,),
+            (self.highlight_connections_check,),
+            ("Bağlantı Toleransı:", self.connection_tolerance_spin),
+            ("Maksimum Arama İterasyonu:", self.max_search_iterations_spin)
+        ))
         layout.addWidget(assembly_group)
         layout.addStretch()
         
-        self.tab_widget.addTab(tab, "Montaj")
+        return tab
     
-    def _create_performance_tab(self):
+    def _create_performance_tab(self) -> QWidget:
         """Performans ayarları tab'ı"""
         tab = QWidget()
         layout = QVBoxLayout(tab)
         
         # Performans Ayarları
         perf_group = QGroupBox("Performans Ayarları")
-        perf_layout = QFormLayout(perf_group)
         
         self.max_triangles_spin = QSpinBox()
         self.max_triangles_spin.setRange(1000, 1000000)
         self.max_triangles_spin.setSuffix(" triangle")
-        perf_layout.addRow("Maksimum Triangle:", self.max_triangles_spin)
         
         self.tessellation_quality_slider = QSlider(Qt.Horizontal)
         self.tessellation_quality_slider.setRange(1, 100)
+        self.tessellation_quality_slider.setTracking(False)  # etiket sadece bırakınca güncellenir
         self.tessellation_quality_label = QLabel("0.5")
         
         tess_layout = QHBoxLayout()
         tess_layout.addWidget(self.tessellation_quality_slider)
         tess_layout.addWidget(self.tessellation_quality_label)
-        perf_layout.addRow("Tessellation Kalitesi:", tess_layout)
-        
-        self.tessellation_quality_slider.valueChanged.connect(
-            lambda v: self.tessellation_quality_label.setText(f"{v/100.0:.2f}")
-        )
         
-        self.use_mesh_cache_check = QCheckBox("Mesh cache kullan")
-        perf_layout.addRow(self.use_mesh_cache_check)
+        self.tessellation_quality_slider.valueChanged.connect(self._on_tessellation_quality_changed)
         
-        self.parallel_processing_check = QCheckBox("Paralel işlem")
-        perf_layout.addRow(self.parallel_processing_check)
+        self.use_mesh_cache_check, self.parallel_processing_check = [
+            QCheckBox(text) for text in ("Mesh cache kullan", "Paralel işlem")
+        ]
         
         self.memory_limit_spin = QSpinBox()
         self.memory_limit_spin.setRange(512, 8192)
         self.memory_limit_spin.setSuffix(" MB")
-        perf_layout.addRow("Bellek Limiti:", self.memory_limit_spin)
         
+        _add_rows(QFormLayout(perf_group), (
+            ("Maksimum Triangle:", self.max_triangles_spin),
+            ("Tessellation Kalitesi:", tess_layout),
+            (self.use_mesh_cache_check,),
+            (self.parallel_processing_check,),
+            ("Bellek Limiti:", self.memory_limit_spin)
+        ))
         layout.addWidget(perf_group)
         layout.addStretch()
         
-        self.tab_widget.addTab(tab, "Performans")
+        return tab
+    
+    @pyqtSlot(int)
+    def _on_mouse_sensitivity_changed(self, value: int):
+        """Mouse hassasiyeti etiketini güncelle"""
+        self.mouse_sensitivity_label.setText("%.1f" % (value / 50.0))
+    
+    @pyqtSlot(int)
+    def _on_transparency_changed(self, value: int):
+        """Şeffaflık etiketini güncelle"""
+        self.transparency_label.setText("%d%%" % value)
+    
+    @pyqtSlot(int)
+    def _on_tessellation_quality_changed(self, value: int):
+        """Tessellation kalitesi etiketini güncelle"""
+        self.tessellation_quality_label.setText("%.2f" % (value / 100.0))
+    
+    def showEvent(self, event):
+        """Dialog gösterildiğinde ilk tab'ı pencere boyandıktan sonra oluştur"""
+        super().showEvent(event)
+        
+        if not self._built:
+            self._built = True
+            QTimer.singleShot(0, self._build_current_tab)
+    
+    @pyqtSlot()
+    def _build_current_tab(self):
+        """Görünen tab'ı oluştur"""
+        self._ensure_tab_built(self.tab_widget.currentIndex())
+    
+    @pyqtSlot(int)
+    def _ensure_tab_built(self, index: int):
+        """Seçilen tab'ı ilk gösterimde oluştur ve ayarlarını yükle"""
+        if index not in self._tab_builders:
+            return
+        
+        name, builder = self._tab_builders.pop(index)
+        tab = builder()
+        
+        # Yer tutucuyu gerçek tab ile değiştir (ara currentChanged sinyalleri bastırılır)
+        self.tab_widget.blockSignals(True)
+        placeholder = self.tab_widget.widget(index)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, tab, name)
+        self.tab_widget.setCurrentIndex(index)
+        self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+        
+        self._built_tabs.append(index)
+        
+        try:
+            self._load_tab_settings(index)
+        except Exception as e:
+            self.logger.error("Ayar yükleme hatası: %s", e)
     
     def _load_settings(self):
         """Mevcut ayarları yükle"""
         try:
-            # Genel ayarlar
-            self.theme_combo.setCurrentText(self.config.get("gui.theme", "light"))
-            self.language_combo.setCurrentText(self.config.get("gui.language", "tr"))
-            self.window_maximized_check.setChecked(self.config.get("gui.window_maximized", False))
-            
-            self.default_dir_edit.setText(self.config.get("import.default_directory", ""))
-            self.max_recent_files_spin.setValue(self.config.get("files.max_recent_files", 10))
-            self.auto_backup_check.setChecked(self.config.get("files.auto_backup", True))
-            
-            self.log_level_combo.setCurrentText(self.config.get("logging.level", "INFO"))
-            self.file_logging_check.setChecked(self.config.get("logging.file_logging", True))
-            self.max_log_files_spin.setValue(self.config.get("logging.max_log_files", 5))
-            
-            # Viewer ayarları
-            self.background_gradient_check.setChecked(self.config.get("viewer.background_gradient", True))
-            self.antialiasing_check.setChecked(self.config.get("viewer.antialiasing", True))
-            self.shadows_check.setChecked(self.config.get("viewer.shadows", True))
-            
-            sensitivity = self.config.get("viewer.mouse_sensitivity", 1.0)
-            self.mouse_sensitivity_slider.setValue(int(sensitivity * 50))
-            
-            self.default_material_combo.setCurrentText(self.config.get("viewer.default_material", "plastic"))
-            
-            transparency = self.config.get("display.transparency", 0.0)
-            self.transparency_slider.setValue(int(transparency * 100))
-            
-            # Import ayarları
-            self.healing_shapes_check.setChecked(self.config.get("import.healing_shapes", True))
-            self.auto_fit_all_check.setChecked(self.config.get("import.auto_fit_all", True))
-            self.import_units_combo.setCurrentText(self.config.get("import.import_units", "mm"))
-            self.content_check_enabled.setChecked(self.config.get("import.check_file_content", True))
-            
-            # Assembly ayarları
-            self.tolerance_spin.setValue(self.config.get("assembly.tolerance", 0.01))
-            self.auto_collision_check.setChecked(self.config.get("assembly.auto_collision_check", True))
-            self.show_constraints_check.setChecked(self.config.get("assembly.show_assembly_constraints", True))
-            self.highlight_connections_check.setChecked(self.config.get("assembly.highlight_connections", True))
-            self.connection_tolerance_spin.setValue(self.config.get("assembly.connection_tolerance", 0.1))
-            self.max_search_iterations_spin.setValue(self.config.get("assembly.max_search_iterations", 100))
-            
-            # Performance ayarları
-            self.max_triangles_spin.setValue(self.config.get("performance.max_triangles", 100000))
-            
-            tess_quality = self.config.get("performance.tessellation_quality", 0.5)
-            self.tessellation_quality_slider.setValue(int(tess_quality * 100))
-            
-            self.use_mesh_cache_check.setChecked(self.config.get("performance.use_mesh_cache", True))
-            self.parallel_processing_check.setChecked(self.config.get("performance.parallel_processing", True))
-            self.memory_limit_spin.setValue(self.config.get("performance.memory_limit_mb", 2048))
+            for index in self._built_tabs:
+                self._load_tab_settings(index)
             
         except Exception as e:
-            self.logger.error(f"Ayar yükleme hatası: {e}")
+            self.logger.error("Ayar yükleme hatası: %s", e)
+    
+    def _load_tab_settings(self, index: int):
+        """Bir tab'ın widget'larını konfigürasyondan doldur"""
+        settings = self.config.as_flat()
+        
+        # Toplu doldurma sırasında ara repaint'leri engelle
+        self.tab_widget.setUpdatesEnabled(False)
+        try:
+            for attr, key, default, kind, scale in self._SETTING_BINDINGS[index]:
+                self._APPLY[kind](getattr(self, attr), settings.get(key, default), scale)
+        finally:
+            self.tab_widget.setUpdatesEnabled(True)
+    
+    def _collect_tab_settings(self, index: int) -> Dict[str, Any]:
+        """Bir tab'ın ayarlarını widget'lardan topla"""
+        return {
+            key: self._READ[kind](getattr(self, attr), scale)
+            for attr, key, default, kind, scale in self._SETTING_BINDINGS[index]
+        }
     
     @pyqtSlot()
     def _browse_default_directory(self):
         """Varsayılan dizin seç"""
-        directory = QFileDialog.getExistingDirectory(
-            self,
-            "Varsayılan Dizin Seç",
-            self.default_dir_edit.text()
-        )
-        
-        if directory:
-            self.default_dir_edit.setText(directory)
+        # Dizin dialog'u ilk tıklamada oluşturulur ve sonraki tıklamalarda tekrar kullanılır
+        if self._dir_dialog is None:
+            self._dir_dialog = QFileDialog(self, "Varsayılan Dizin Seç")
+            self._dir_dialog.setFileMode(QFileDialog.Directory)
+            self._dir_dialog.setOption(QFileDialog.ShowDirsOnly, True)
+        
+        self._dir_dialog.setDirectory(self.default_dir_edit.text())
+        
+        if self._dir_dialog.exec_():
+            selected = self._dir_dialog.selectedFiles()
+            if selected:
+                self.default_dir_edit.setText(selected[0])
     
     @pyqtSlot()
     def _save_settings(self):
         """Ayarları kaydet"""
         try:
-            # Genel ayarlar
-            self.config.set("gui.theme", self.theme_combo.currentText())
-            self.config.set("gui.language", self.language_combo.currentText())
-            self.config.set("gui.window_maximized", self.window_maximized_check.isChecked())
+            # Sadece oluşturulmuş tab'ların ayarları toplanır
+            new_settings = {}
+            for index in self._built_tabs:
+                new_settings.update(self._collect_tab_settings(index))
             
-            self.config.set("import.default_directory", self.default_dir_edit.text())
-            self.config.set("files.max_recent_files", self.max_recent_files_spin.value())
-            self.config.set("files.auto_backup", self.auto_backup_check.isChecked())
+            # Sadece değişen anahtarlar yazılır, değişiklik yoksa dosyaya dokunulmaz
+            current_settings = self.config.as_flat()
+            changed_settings = {key: value for key, value in new_settings.items()
+                                if current_settings.get(key) != value}
             
-            self.config.set("logging.level", self.log_level_combo.currentText())
-            self.config.set("logging.file_logging", self.file_logging_check.isChecked())
-            self.config.set("logging.max_log_files", self.max_log_files_spin.value())
+            if not changed_settings:
+                self.accept()
+                return
             
-            # Viewer ayarları
-            self.config.set("viewer.background_gradient", self.background_gradient_check.isChecked())
-            self.config.set("viewer.antialiasing", self.antialiasing_check.isChecked())
-            self.config.set("viewer.shadows", self.shadows_check.isChecked())
-            self.config.set("viewer.mouse_sensitivity", self.mouse_sensitivity_slider.value() / 50.0)
-            self.config.set("viewer.default_material", self.default_material_combo.currentText())
-            self.config.set("display.transparency", self.transparency_slider.value() / 100.0)
+            # Tek birleştirme ve tek dosya yazımı
+            self.config.update_settings(self._nest_settings(changed_settings))
             
-            # Import ayarları
-            self.config.set("import.healing_shapes", self.healing_shapes_check.isChecked())
-            self.config.set("import.auto_fit_all", self.auto_fit_all_check.isChecked())
-            self.config.set("import.import_units", self.import_units_combo.currentText())
-            self.config.set("import.check_file_content", self.content_check_enabled.isChecked())
-            
-            # Assembly ayarları
-            self.config.set("assembly.tolerance", self.tolerance_spin.value())
-            self.config.set("assembly.auto_collision_check", self.auto_collision_check.isChecked())
-            self.config.set("assembly.show_assembly_constraints", self.show_constraints_check.isChecked())
-            self.config.set("assembly.highlight_connections", self.highlight_connections_check.isChecked())
-            self.config.set("assembly.connection_tolerance", self.connection_tolerance_spin.value())
-            self.config.set("assembly.max_search_iterations", self.max_search_iterations_spin.value())
-            
-            # Performance ayarları
-            self.config.set("performance.max_triangles", self.max_triangles_spin.value())
-            self.config.set("performance.tessellation_quality", self.tessellation_quality_slider.value() / 100.0)
-            self.config.set("performance.use_mesh_cache", self.use_mesh_cache_check.isChecked())
-            self.config.set("performance.parallel_processing", self.parallel_processing_check.isChecked())
-            self.config.set("performance.memory_limit_mb", self.memory_limit_spin.value())
-            
-            # Ayarları dosyaya kaydet
-            self.config.save()
-            
-            self.logger.info("Ayarlar kaydedildi")
+            self.logger.info("Ayarlar kaydedildi (%d değişiklik)", len(changed_settings))
             self.accept()
             
         except Exception as e:
-            self.logger.error(f"Ayar kaydetme hatası: {e}")
+            self.logger.error("Ayar kaydetme hatası: %s", e)
             QMessageBox.critical(self, "Hata", f"Ayarlar kaydedilemedi: {str(e)}")
     
+    @staticmethod
+    def _nest_settings(flat_settings: Dict[str, Any]) -> Dict[str, Any]:
+        """Nokta notasyonlu anahtarları iç içe dictionary'ye çevir"""
+        nested = {}
+        for key, value in flat_settings.items():
+            section, _, name = key.partition('.')
+            nested.setdefault(section, {})[name] = value
+        return nested
+    
     @pyqtSlot()
     def _restore_defaults(self):
         """Varsayılan ayarlara dön"""
@@ -465,31 +623,19 @@ class AboutDialog(QDialog):
         
         # Logo/Icon alanı
         icon_label = QLabel()
-        # icon_label.setPixmap(QPixmap("resources/icons/app_icon.png").scaled(64, 64))
+        if os.path.exists(_APP_ICON_PATH):
+            icon_label.setPixmap(_pixmap(_APP_ICON_PATH, 64))
         icon_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(icon_label)
         
         # Uygulama bilgileri
-        app_info = QLabel(f"""
-<h2>{APP_NAME}</h2>
-<p><b>Versiyon:</b> {APP_VERSION}</p>
-<p><b>Geliştirici:</b> CAD Developer</p>
-<p><b>Açıklama:</b> STEP dosyalarının montajı için CAD uygulaması</p>
-        """)
+        app_info = QLabel(_APP_INFO_HTML)
         app_info.setAlignment(Qt.AlignCenter)
         app_info.setWordWrap(True)
         layout.addWidget(app_info)
         
         # Teknoloji bilgileri
-        tech_info = QLabel("""
-<h3>Kullanılan Teknolojiler:</h3>
-<ul>
-<li>Python 3.x</li>
-<li>PyQt5</li>
-<li>PythonOCC Core 7.7.2</li>
-<li>OpenCASCADE</li>
-</ul>
-        """)
+        tech_info = QLabel(_TECH_INFO_HTML)
         tech_info.setWordWrap(True)
         layout.addWidget(tech_info)
         
@@ -512,8 +658,17 @@ class FileInfoDialog(QDialog):
         super().__init__(parent)
         
         self.shape_data = shape_data
+        self._populated = set()  # doldurulmuş tab index'leri
+        self._shown = False
         self._setup_ui()
-        self._populate_data()
+    
+    def showEvent(self, event):
+        """Dialog gösterildiğinde görünen tab'ı pencere boyandıktan sonra doldur"""
+        super().showEvent(event)
+        
+        if not self._shown:
+            self._shown = True
+            QTimer.singleShot(0, self._populate_current_tab)
     
     def _setup_ui(self):
         """UI'yi kur"""
@@ -536,6 +691,14 @@ class FileInfoDialog(QDialog):
         # Analiz sonuçları tab'ı
         self._create_analysis_tab()
         
+        # Her tab ilk görüntülendiğinde bir kez doldurulur
+        self._tab_populators = {
+            self._general_tab_index: self._populate_general,
+            self._geometry_tab_index: self._populate_geometry,
+            self._analysis_tab_index: self._populate_analysis
+        }
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
+        
         # Kapatma butonu
         close_btn = QPushButton("Kapat")
         close_btn.clicked.connect(self.accept)
@@ -567,7 +730,7 @@ class FileInfoDialog(QDialog):
         layout.addRow("İçe Aktarma Zamanı:", self.import_time_label)
         layout.addRow("İçe Aktarma Durumu:", self.import_success_label)
         
-        self.tab_widget.addTab(tab, "Genel")
+        self._general_tab_index = self.tab_widget.addTab(tab, "Genel")
     
     def _create_geometry_tab(self):
         """Geometri bilgileri tab'ı"""
@@ -579,51 +742,26 @@ class FileInfoDialog(QDialog):
         scroll_widget = QWidget()
         scroll_layout = QFormLayout(scroll_widget)
         
-        # Geometri bilgisi widget'ları
-        self.topology_labels = {}
-        self.properties_labels = {}
-        self.bbox_labels = {}
-        
-        # Topology grubu
-        topology_group = QGroupBox("Topology")
-        topology_layout = QFormLayout(topology_group)
-        
-        topology_items = ["num_solids", "num_faces", "num_edges", "num_vertices"]
-        for item in topology_items:
-            label = QLabel()
-            self.topology_labels[item] = label
-            topology_layout.addRow(f"{item}:", label)
-        
-        scroll_layout.addRow(topology_group)
-        
-        # Properties grubu
-        properties_group = QGroupBox("Özellikler")
-        props_layout = QFormLayout(properties_group)
-        
-        props_items = ["volume", "surface_area", "center_of_mass"]
-        for item in props_items:
-            label = QLabel()
-            self.properties_labels[item] = label
-            props_layout.addRow(f"{item}:", label)
-        
-        scroll_layout.addRow(properties_group)
-        
-        # Bounding box grubu
-        bbox_group = QGroupBox("Bounding Box")
-        bbox_layout = QFormLayout(bbox_group)
+        # Geometri bilgisi widget'ları: analiz bölümü -> {alan: label}
+        self._label_groups = {
+            section: {item: QLabel() for item in items}
+            for _, section, items in _GEOM_GROUPS
+        }
         
-        bbox_items = ["width", "height", "depth", "center"]
-        for item in bbox_items:
-            label = QLabel()
-            self.bbox_labels[item] = label
-            bbox_layout.addRow(f"{item}:", label)
-        
-        scroll_layout.addRow(bbox_group)
+        for title, section, items in _GEOM_GROUPS:
+            group = QGroupBox(title)
+            group_layout = QFormLayout(group)
+            
+            labels = self._label_groups[section]
+            for item in items:
+                group_layout.addRow(f"{item}:", labels[item])
+            
+            scroll_layout.addRow(group)
         
         scroll.setWidget(scroll_widget)
         layout.addWidget(scroll)
         
-        self.tab_widget.addTab(tab, "Geometri")
+        self._geometry_tab_index = self.tab_widget.addTab(tab, "Geometri")
     
     def _create_analysis_tab(self):
         """Analiz sonuçları tab'ı"""
@@ -634,15 +772,33 @@ class FileInfoDialog(QDialog):
         self.analysis_text.setReadOnly(True)
         layout.addWidget(self.analysis_text)
         
-        self.tab_widget.addTab(tab, "Analiz")
+        self._analysis_tab_index = self.tab_widget.addTab(tab, "Analiz")
+    
+    @pyqtSlot()
+    def _populate_current_tab(self):
+        """Görünen tab'ı doldur"""
+        self._on_tab_changed(self.tab_widget.currentIndex())
+    
+    @pyqtSlot(int)
+    def _on_tab_changed(self, index: int):
+        """Tab ilk kez görüntülendiğinde verilerini doldur"""
+        if index in self._populated or index not in self._tab_populators:
+            return
+        
+        self._populated.add(index)
+        
+        # Toplu doldurma sırasında ara repaint'leri engelle
+        self.tab_widget.setUpdatesEnabled(False)
+        try:
+            self._tab_populators[index]()
+        finally:
+            self.tab_widget.setUpdatesEnabled(True)
     
-    def _populate_data(self):
-        """Verileri doldur"""
+    def _populate_general(self):
+        """Genel bilgileri doldur"""
         try:
             metadata = self.shape_data.get("metadata", {})
-            analysis = self.shape_data.get("analysis", {})
             
-            # Genel bilgiler
             self.file_name_label.setText(metadata.get("file_name", "Bilinmeyen"))
             self.file_path_label.setText(metadata.get("file_path", "Bilinmeyen"))
             
@@ -653,54 +809,49 @@ class FileInfoDialog(QDialog):
             self.import_time_label.setText(metadata.get("import_time", "Bilinmeyen"))
             
             success = metadata.get("import_successful", False)
-            self.import_success_label.setText("✓ Başarılı" if success else "✗ Başarısız")
+            self.import_success_label.setText(_IMPORT_SUCCESS_TEXT if success else _IMPORT_FAILED_TEXT)
             
-            # Geometri bilgileri
-            basic_geom = analysis.get("basic_geometry", {})
-            topology = basic_geom.get("topology", {})
-            
-            for item, label in self.topology_labels.items():
-                value = topology.get(item, 0)
-                label.setText(str(value))
+        except Exception as e:
+            _logger.error("Veri doldurma hatası: %s", e)
+    
+    def _populate_geometry(self):
+        """Geometri bilgilerini doldur"""
+        try:
+            analysis = self.shape_data.get("analysis", {})
             
-            properties = basic_geom.get("properties", {})
-            for item, label in self.properties_labels.items():
-                if item == "center_of_mass" and item in properties:
-                    center = properties[item]
-                    if isinstance(center, (list, tuple)) and len(center) >= 3:
-                        label.setText(f"({center[0]:.2f}, {center[1]:.2f}, {center[2]:.2f})")
-                    else:
-                        label.setText("N/A")
-                else:
-                    value = properties.get(item, 0)
-                    if isinstance(value, float):
-                        label.setText(f"{value:.2f}")
-                    else:
-                        label.setText(str(value))
+            basic_geom = analysis.get("basic_geometry", {})
             
-            bbox = basic_geom.get("bounding_box", {})
-            for item, label in self.bbox_labels.items():
-                if item == "center" and item in bbox:
-                    center = bbox[item]
-                    if isinstance(center, (list, tuple)) and len(center) >= 3:
-                        label.setText(f"({center[0]:.2f}, {center[1]:.2f}, {center[2]:.2f})")
-                    else:
-                        label.setText("N/A")
-                else:
-                    value = bbox.get(item, 0)
-                    if isinstance(value, float):
-                        label.setText(f"{value:.2f}")
+            for section, labels in self._label_groups.items():
+                values = basic_geom.get(section, {})
+                
+                for item, label in labels.items():
+                    if item in _CENTER_ITEMS and item in values:
+                        center = values[item]
+                        if isinstance(center, (list, tuple)) and len(center) >= 3:
+                            x, y, z = center[:3]
+                            label.setText(_CENTER_FMT % (x, y, z))
+                        else:
+                            label.setText("N/A")
                     else:
-                        label.setText(str(value))
+                        value = values.get(item, 0)
+                        if isinstance(value, float):
+                            label.setText("%.2f" % value)
+                        else:
+                            label.setText(str(value))
             
-            # Analiz raporu
+        except Exception as e:
+            _logger.error("Veri doldurma hatası: %s", e)
+    
+    def _populate_analysis(self):
+        """Analiz raporunu oluştur (analyzer sadece bu tab açılınca yüklenir)"""
+        try:
             from import_manager.geometry_analyzer import GeometryAnalyzer
             analyzer = GeometryAnalyzer()
-            report = analyzer.generate_analysis_report(analysis)
+            report = analyzer.generate_analysis_report(self.shape_data.get("analysis", {}))
             self.analysis_text.setPlainText(report)
             
         except Exception as e:
-            logging.error(f"Veri doldurma hatası: {e}")
+            _logger.error("Analiz raporu oluşturma hatası: %s", e)
 
 class ProgressDialog(QDialog):
     """İşlem progress dialog'u"""
@@ -732,30 +883,194 @@ class ProgressDialog(QDialog):
         btn_layout.addWidget(self.cancel_btn)
         
         layout.addLayout(btn_layout)
+        
+        # Progress güncellemeleri biriktirilip en fazla ~30 Hz ile uygulanır
+        self._pending_progress = None
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(33)
+        self._flush_timer.timeout.connect(self._flush_progress)
     
+    @pyqtSlot(int)
+    @pyqtSlot(int, int)
     def set_progress(self, value: int, maximum: int = 100):
         """Progress değerini ayarla"""
-        self.progress_bar.setRange(0, maximum)
+        self._pending_progress = (value, maximum)
+        
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    @pyqtSlot()
+    def _flush_progress(self):
+        """Bekleyen son progress değerini uygula"""
+        if self._pending_progress is None or not self.isVisible():
+            return
+        
+        value, maximum = self._pending_progress
+        self._pending_progress = None
+        
+        if self.progress_bar.maximum() != maximum:
+            self.progress_bar.setRange(0, maximum)
         self.progress_bar.setValue(value)
     
+    def showEvent(self, event):
+        """Gizliyken biriken progress değerini gösterimde uygula"""
+        super().showEvent(event)
+        self._flush_progress()
+    
+    @pyqtSlot(str)
     def set_message(self, message: str):
         """Mesajı güncelle"""
         self.message_label.setText(message)
 
+def _default_log_path() -> Optional[str]:
+    """Varsayılan log dizinindeki en güncel log dosyasını bul"""
+    log_directory = os.path.join(os.path.expanduser("~"), ".cad_montaj", "logs")
+    try:
+        entries = [e for e in os.scandir(log_directory) if e.is_file() and e.name.endswith(".log")]
+    except OSError:
+        return None
+    if not entries:
+        return None
+    return max(entries, key=lambda e: e.stat().st_mtime).path
+
+def _read_log_buffer(path: str):
+    """Log dosyasını oku - büyük dosyalar kopyalanmadan belleğe eşlenir"""
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        # Küçük dosyalarda sayfa eşleme maliyeti kazançtan büyük
+        if size < _MMAP_THRESHOLD:
+            return f.read()
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+class LogListModel(QAbstractListModel):
+    """Log satırları için model - sadece görünen satırlar view tarafından istenir"""
+    
+    # Seviye fırçaları bir kez oluşturulur; data() sadece referans döndürür
+    # (INFO varsayılan palet rengini kullanır)
+    _LEVEL_BRUSHES = {
+        "DEBUG": QBrush(QColor(128, 128, 128)),     # Gri
+        "WARNING": QBrush(QColor(255, 140, 0)),     # Turuncu
+        "ERROR": QBrush(QColor(255, 0, 0)),         # Kırmızı
+        "CRITICAL": QBrush(QColor(139, 0, 0))       # Koyu kırmızı
+    }
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._buf = b""
+        # Halka tampon: en fazla _MAXIMUM_BLOCK_COUNT satır, en eskiler O(1) atılır
+        self._rows = collections.deque(maxlen=_MAXIMUM_BLOCK_COUNT)
+        # Çözülmüş satır metinleri - hover/scroll ile tekrar eden data() çağrıları için
+        self._decode = functools.lru_cache(maxsize=4096)(self._decode_span)
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        start, end, level = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            # Satır metni sadece view istediğinde, satır başına bir kez çözülür
+            return self._decode(start, end)
+        if role == Qt.ForegroundRole:
+            return self._LEVEL_BRUSHES.get(level)
+        return None
+    
+    def _decode_span(self, start: int, end: int) -> str:
+        """Tampondaki satırı metne çevir (geçersiz UTF-8 byte'ları yer tutucu olur)"""
+        # strip() değil: baştaki boşluklar traceback girintisini taşır, sadece
+        # Windows satır sonundan kalan "\r" atılır
+        return self._buf[start:end].rstrip(b"\r\n").decode("utf-8", errors="replace")
+    
+    def set_buffer(self, buf, spans):
+        """Log tamponunu ve satır aralıklarını tek bir model reset'i ile değiştir"""
+        self.beginResetModel()
+        self._decode.cache_clear()
+        # deque üreteci tüketirken sadece son _MAXIMUM_BLOCK_COUNT satırı tutar
+        self._rows = collections.deque(iter_rows(buf, spans), maxlen=_MAXIMUM_BLOCK_COUNT)
+        self._swap_buffer(buf)
+        self.endResetModel()
+    
+    def append_rows(self, buf, spans):
+        """Dosyaya eklenen satırları ekle - tampon doluysa en eski satırlar atılır
+        
+        Args:
+            buf: Büyümüş dosyanın tamponu (mevcut satır aralıkları geçerli kalır)
+            spans: Son bilinen satırdan itibaren satır aralıkları
+        """
+        self._swap_buffer(buf)
+        if not spans:
+            return
+        
+        level = self._rows[-1][2] if self._rows else None
+        first_new = 0
+        
+        # Önceki taramada yarım kalan son satır uzamış olabilir
+        if self._rows and spans[0][0] == self._rows[-1][0]:
+            prev_level = self._rows[-2][2] if len(self._rows) > 1 else None
+            self._rows[-1] = next(iter_rows(buf, spans[:1], prev_level))
+            last = self.index(len(self._rows) - 1, 0)
+            self.dataChanged.emit(last, last)
+            level = self._rows[-1][2]
+            first_new = 1
+        
+        new_rows = collections.deque(
+            iter_rows(buf, itertools.islice(spans, first_new, None), level),
+            maxlen=_MAXIMUM_BLOCK_COUNT
+        )
+        if not new_rows:
+            return
+        
+        # Kapasite aşılacaksa atılacak baş satırları view'a önceden bildir
+        removed = min(len(self._rows) + len(new_rows) - _MAXIMUM_BLOCK_COUNT, len(self._rows))
+        if removed > 0:
+            self.beginRemoveRows(QModelIndex(), 0, removed - 1)
+            for _ in range(removed):
+                self._rows.popleft()
+            self.endRemoveRows()
+        
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(new_rows) - 1)
+        self._rows.extend(new_rows)
+        self.endInsertRows()
+    
+    def _swap_buffer(self, buf):
+        """Tamponu değiştir, eski eşlenmiş dosyayı kapat"""
+        old_buf, self._buf = self._buf, buf
+        if isinstance(old_buf, mmap.mmap) and old_buf is not buf:
+            old_buf.close()
+    
+    def clear(self):
+        """Satırları temizle ve eşlenmiş dosyayı bırak"""
+        self.set_buffer(b"", [])
+
 class LogViewerDialog(QDialog):
     """Log görüntüleyici dialog'u"""
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, log_path: Optional[str] = None):
         super().__init__(parent)
         
+        self.log_path = log_path or _default_log_path()
+        
+        # Satır offset indeksi - dosya başına bir kez, sonra sadece eklenen kısım taranır
+        self._line_offsets = None
+        self._scanned_to = 0
+        
         self.setWindowTitle("Log Görüntüleyici")
         self.resize(600, 400)
         
         layout = QVBoxLayout(self)
         
-        # Log listesi
-        self.log_list = QListWidget()
-        layout.addWidget(self.log_list)
+        # Log listesi (model/view - sadece görünen satırlar çizilir)
+        self.model = LogListModel(self)
+        self.view = QListView()
+        self.view.setModel(self.model)
+        self.view.setWordWrap(False)
+        # Eşit satır boyu: satır konumu içerik ölçülmeden çarpma ile hesaplanır
+        self.view.setUniformItemSizes(True)
+        layout.addWidget(self.view)
         
         # Butonlar
         btn_layout = QHBoxLayout()
@@ -776,24 +1091,85 @@ class LogViewerDialog(QDialog):
         
         layout.addLayout(btn_layout)
         
-        self._refresh_logs()
+        # Art arda gelen yenileme istekleri tek bir yenilemede birleştirilir
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(80)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+        
+        # Log'lar dialog ilk gösterildiğinde yüklenir
+        self._refresh_pending = True
+    
+    def showEvent(self, event):
+        """Gizliyken ertelenen yenilemeyi tek seferde uygula"""
+        super().showEvent(event)
+        if self._refresh_pending:
+            self._do_refresh()
     
+    @pyqtSlot()
     def _refresh_logs(self):
+        """Log yenilemesi iste - bekleyen istek varsa süre yeniden başlar"""
+        self._refresh_timer.start()
+    
+    @pyqtSlot()
+    def _do_refresh(self):
         """Log'ları yenile"""
-        # Bu implementation log dosyasından okuyabilir
-        # Şimdilik basit bir örnek
-        sample_logs = [
-            "[INFO] Uygulama başlatıldı",
-            "[DEBUG] Viewer oluşturuldu", 
-            "[INFO] Dosya yüklendi: example.step",
-            "[WARNING] Geometri healing uygulandı",
-            "[ERROR] Montaj başarısız: uygun bağlantı bulunamadı"
-        ]
-        
-        self.log_list.clear()
-        for log_entry in sample_logs:
-            self.log_list.addItem(log_entry)
+        # Gizli dialog'da view'a satır ekleme; gösterilince bir kez yenilenir
+        if not self.isVisible():
+            self._refresh_pending = True
+            return
+        self._refresh_pending = False
+        
+        if self.log_path and os.path.isfile(self.log_path):
+            try:
+                self._load_log_file()
+            except (OSError, ValueError) as e:
+                _logger.warning("Log dosyası okunamadı: %s", e)
+            else:
+                return
+        
+        # Log dosyası yoksa örnek satırları göster
+        buf = _SAMPLE_LOG_BYTES
+        self._line_offsets = None
+        line_starts = np.concatenate(([0], scan_line_starts(buf)))
+        self.model.set_buffer(buf, line_spans(line_starts, len(buf), _MAXIMUM_BLOCK_COUNT))
     
+    def _load_log_file(self):
+        """Log dosyasını yükle - sadece son taramadan sonra eklenen byte'lar taranır"""
+        if self._line_offsets is not None and os.path.getsize(self.log_path) == self._scanned_to:
+            return  # Dosya değişmemiş
+        
+        buf = _read_log_buffer(self.log_path)
+        size = len(buf)
+        
+        if self._line_offsets is None or size < self._scanned_to:
+            # İlk yükleme veya dosya döndürülmüş: tamamını tara
+            self._line_offsets = np.concatenate(([0], scan_line_starts(buf)))
+            self._scanned_to = size
+            self.model.set_buffer(buf, line_spans(self._line_offsets, size, _MAXIMUM_BLOCK_COUNT))
+            return
+        
+        # Dosya büyümüş: sadece yeni satırları modele ekle
+        known = len(self._line_offsets)
+        self._line_offsets = np.concatenate(
+            (self._line_offsets, scan_line_starts(buf, self._scanned_to))
+        )
+        self._scanned_to = size
+        self.model.append_rows(
+            buf, line_spans(self._line_offsets[known - 1:], size, _MAXIMUM_BLOCK_COUNT)
+        )
+    
+    @pyqtSlot()
     def _clear_logs(self):
         """Log'ları temizle"""
-        self.log_list.clear()
\ No newline at end of file
+        self._line_offsets = None
+        self.model.clear()
+    
+    def done(self, result: int):
+        """Dialog kapanırken eşlenmiş log dosyasını bırak"""
+        self._refresh_timer.stop()
+        self._line_offsets = None
+        self.model.clear()
+        # Dialog tekrar açılırsa log'lar yeniden yüklenir
+        self._refresh_pending = True
+        super().done(result)
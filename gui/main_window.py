@@ -5,16 +5,22 @@ PyQt5 tabanlı ana kullanıcı arayüzü
 
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Dict, Any, Optional, List
+
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
-    QTreeWidget, QTreeWidgetItem, QTabWidget, QTextEdit, QLabel,
-    QProgressBar, QStatusBar, QMenuBar, QMenu, QAction, QFileDialog,
+    QTreeView, QTabWidget, QPlainTextEdit, QLabel,
+    QProgressBar, QStatusBar, QMenuBar, QMenu, QAction, QActionGroup, QFileDialog,
     QMessageBox, QApplication, QDockWidget, QGroupBox, QFormLayout,
     QLineEdit, QPushButton, QComboBox, QSpinBox, QDoubleSpinBox,
     QCheckBox, QSlider, QFrame
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QThread, pyqtSlot
+from PyQt5.QtCore import (
+    Qt, pyqtSignal, QTimer, QThread, pyqtSlot, QAbstractItemModel, QModelIndex,
+    QObject, QRunnable, QThreadPool, QFileSystemWatcher
+)
 from PyQt5.QtGui import QIcon, QPixmap, QFont, QKeySequence
 
 from .toolbar import MainToolbar
@@ -23,38 +29,322 @@ from .widgets import PropertyPanel, LogWidget, ProgressWidget
 
 from engine_3d import CADViewer, create_viewer
 from import_manager import import_cad_file, get_supported_formats
-from montaj import AssemblyEngine, create_assembly_engine
+from montaj import (
+    AssemblyEngine, AABBTree, create_assembly_engine, conservative_aabb, pairs_from_hits
+)
 from utils import Config, CADLogger, APP_NAME, APP_VERSION, GUIDefaults, Shortcuts
 
-class ImportWorker(QThread):
-    """Dosya import işlemi için worker thread"""
+class ImportSignals(QObject):
+    """Import worker sinyalleri (QRunnable sinyal taşıyamaz)"""
     
     import_finished = pyqtSignal(object, dict, dict)  # shape, metadata, analysis
     import_progress = pyqtSignal(int)  # progress percentage
     import_error = pyqtSignal(str)  # error message
+    import_cancelled = pyqtSignal()  # kullanıcı iptal etti
+    finished = pyqtSignal()  # worker işini bitirdi (başarılı veya değil)
+
+class ImportWorker(QRunnable):
+    """Dosya import işlemi için thread pool görevi"""
     
     def __init__(self, file_path: str, config: Config):
         super().__init__()
         self.file_path = file_path
         self.config = config
+        self.signals = ImportSignals()
+        self._cancel = False
+        # Ömrü MainWindow._active_workers ile yönetilir
+        self.setAutoDelete(False)
+    
+    def cancel(self):
+        """Import'u bir sonraki aşama sınırında iptal et"""
+        self._cancel = True
         
     def run(self):
         try:
-            self.import_progress.emit(10)
+            self.signals.import_progress.emit(10)
+            
+            # Import işlemi (ilerleme sinyalleri thread'ler arası kuyruklanır)
+            shape, metadata, analysis = import_cad_file(
+                self.file_path, self.config,
+                progress_cb=self.signals.import_progress.emit,
+                cancel_cb=lambda: self._cancel
+            )
             
-            # Import işlemi
-            shape, metadata, analysis = import_cad_file(self.file_path, self.config)
+            if metadata.get("cancelled"):
+                self.signals.import_cancelled.emit()
+                return
+            
+            # Model ağacı satırlarını UI thread dışında hazırla
+            if isinstance(analysis, dict):
+                topology_rows = _topology_rows(analysis)
+                if topology_rows is not None:
+                    analysis["_topology_rows"] = topology_rows
             
-            self.import_progress.emit(100)
+            self.signals.import_progress.emit(100)
             
             if shape is not None:
-                self.import_finished.emit(shape, metadata, analysis)
+                self.signals.import_finished.emit(shape, metadata, analysis)
             else:
                 error_msg = metadata.get("error", "Bilinmeyen import hatası")
-                self.import_error.emit(error_msg)
+                self.signals.import_error.emit(error_msg)
+                
+        except Exception as e:
+            self.signals.import_error.emit(str(e))
+        finally:
+            self.signals.finished.emit()
+
+class CollisionSignals(QObject):
+    """Çakışma kontrolü worker sinyalleri"""
+    
+    collision_finished = pyqtSignal(int)  # çakışma sayısı
+    collision_progress = pyqtSignal(int)  # progress percentage
+    collision_error = pyqtSignal(str)  # error message
+    collision_cancelled = pyqtSignal()  # kullanıcı iptal etti
+    finished = pyqtSignal()  # worker işini bitirdi (başarılı veya değil)
+
+class CollisionWorker(QRunnable):
+    """Dar faz çakışma kontrolü için thread pool görevi"""
+    
+    def __init__(self, detector, pairs: List[tuple], executor: ThreadPoolExecutor):
+        super().__init__()
+        self.detector = detector
+        self.pairs = pairs  # [(shape1, shape2), ...] geniş fazdan geçen çiftler
+        self.executor = executor
+        self.signals = CollisionSignals()
+        self._cancel = False
+        # Ömrü MainWindow.collision_worker ile yönetilir
+        self.setAutoDelete(False)
+    
+    def cancel(self):
+        """Henüz başlamamış çift kontrollerini iptal et"""
+        self._cancel = True
+    
+    def run(self):
+        futures = []
+        try:
+            futures = [self.executor.submit(_check_pair, self.detector, pair) for pair in self.pairs]
+            
+            collision_count = 0
+            last_percent = -1
+            for done, future in enumerate(futures, 1):
+                if self._cancel:
+                    for pending in futures:
+                        pending.cancel()
+                    self.signals.collision_cancelled.emit()
+                    return
                 
+                if future.result():
+                    collision_count += 1
+                
+                percent = done * 100 // len(futures)
+                if percent != last_percent:
+                    last_percent = percent
+                    self.signals.collision_progress.emit(percent)
+            
+            self.signals.collision_finished.emit(collision_count)
+            
         except Exception as e:
-            self.import_error.emit(str(e))
+            for pending in futures:
+                pending.cancel()
+            self.signals.collision_error.emit(str(e))
+        finally:
+            self.signals.finished.emit()
+
+class _RecentFilesSignals(QObject):
+    """Son dosya kontrolü sinyalleri"""
+    
+    checked = pyqtSignal(dict)  # file_path -> dosya var mı
+
+class _RecentFilesCheck(QRunnable):
+    """Son dosyaların varlığını UI thread dışında kontrol et"""
+    
+    def __init__(self, file_paths: List[str]):
+        super().__init__()
+        self.file_paths = list(file_paths)
+        self.signals = _RecentFilesSignals()
+        self.setAutoDelete(False)
+    
+    def run(self):
+        result = {}
+        for file_path in self.file_paths:
+            try:
+                os.stat(file_path)
+                result[file_path] = True
+            except OSError:
+                result[file_path] = False
+        self.signals.checked.emit(result)
+
+# Menü kısayolları (QKeySequence'lar bir kez ayrıştırılır)
+_SHORTCUT_NAMES = (
+    "OPEN", "SAVE", "SAVE_AS", "EXIT", "FIT_ALL",
+    "START_ASSEMBLY", "CHECK_COLLISION", "SETTINGS", "HELP"
+)
+_SHORTCUTS: Dict[str, QKeySequence] = {}
+
+def _invoke(func, *_args):
+    """Sinyal argümanlarını (ör. checked) yok sayarak func'ı çağır"""
+    return func()
+
+def _check_pair(detector, pair: tuple) -> bool:
+    """Dar faz: tek bir (shape1, shape2) çiftini kontrol et"""
+    return detector.check_collision(*pair)
+
+def _ensure_shortcuts() -> Dict[str, QKeySequence]:
+    """Kısayol önbelleğini ilk kullanımda (QApplication varken) doldur"""
+    if not _SHORTCUTS and QApplication.instance() is not None:
+        for name in _SHORTCUT_NAMES:
+            _SHORTCUTS[name] = QKeySequence(getattr(Shortcuts, name))
+    return _SHORTCUTS
+
+def _topology_rows(analysis: Dict[str, Any]) -> Optional[List[tuple]]:
+    """Analizdeki pozitif topoloji sayılarını (anahtar, değer) listesine çevir"""
+    basic_geom = analysis.get("basic_geometry") or {}
+    if not basic_geom:
+        return None
+    
+    return [
+        (key, value) for key, value in (basic_geom.get("topology") or {}).items()
+        if isinstance(value, int) and value > 0
+    ]
+
+def _shape_aabb(analysis: Optional[Dict[str, Any]]) -> Optional[tuple]:
+    """Analizdeki bounding box'tan (xmin, ymin, zmin, xmax, ymax, zmax) çıkar"""
+    bbox = ((analysis or {}).get("basic_geometry") or {}).get("bounding_box") or {}
+    try:
+        return conservative_aabb([bbox[key] for key in ("xmin", "ymin", "zmin", "xmax", "ymax", "zmax")])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+class ShapeRecord:
+    """Yüklü parça kaydı (shape verisi dict yerine __slots__'lu nesnede tutulur)"""
+    
+    __slots__ = ("shape", "metadata", "analysis", "file_path", "display_name", "ais_shape", "aabb")
+    
+    def __init__(self, shape, metadata: Dict[str, Any], analysis: Dict[str, Any],
+                 file_path: str = "", display_name: str = "", ais_shape=None,
+                 aabb: Optional[tuple] = None):
+        self.shape = shape
+        self.metadata = metadata
+        self.analysis = analysis
+        self.file_path = file_path
+        self.display_name = display_name
+        self.ais_shape = ais_shape
+        self.aabb = aabb
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Dict bekleyen dialog ve paneller için sözlük görünümü"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+class _TreeNode:
+    """Model ağacı düğümü"""
+    
+    __slots__ = ("columns", "shape_id", "parent", "children")
+    
+    def __init__(self, columns, shape_id=None, parent=None):
+        self.columns = columns
+        self.shape_id = shape_id
+        self.parent = parent
+        self.children = []
+
+class ShapeTreeModel(QAbstractItemModel):
+    """Model ağacı - yüklenen parçalar ve topology bilgileri
+    
+    Satır başına widget item oluşturulmaz; view sadece görünen satırları ister.
+    """
+    
+    HEADERS = ("Model", "Tür", "Durum")
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._root = _TreeNode(())
+        self._items = {}  # shape_id -> üst seviye düğüm
+    
+    def _node(self, index: QModelIndex) -> _TreeNode:
+        return index.internalPointer() if index.isValid() else self._root
+    
+    def index(self, row: int, column: int, parent=QModelIndex()) -> QModelIndex:
+        children = self._node(parent).children
+        if 0 <= row < len(children) and 0 <= column < len(self.HEADERS):
+            return self.createIndex(row, column, children[row])
+        return QModelIndex()
+    
+    def parent(self, index: QModelIndex) -> QModelIndex:
+        if not index.isValid():
+            return QModelIndex()
+        
+        parent_node = index.internalPointer().parent
+        if parent_node is None or parent_node is self._root:
+            return QModelIndex()
+        return self.createIndex(parent_node.parent.children.index(parent_node), 0, parent_node)
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.column() > 0:
+            return 0
+        return len(self._node(parent).children)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return len(self.HEADERS)
+    
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        node = index.internalPointer()
+        if role == Qt.DisplayRole:
+            column = index.column()
+            return node.columns[column] if column < len(node.columns) else None
+        if role == Qt.UserRole:
+            return node.shape_id
+        return None
+    
+    def headerData(self, section: int, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+    
+    def add_shape(self, shape_id: str, file_name: str, extension: str, topology_rows) -> QModelIndex:
+        """Parçayı topology alt satırları ile birlikte tek bir ekleme ile ekle"""
+        return self.add_shapes([(shape_id, file_name, extension, topology_rows)])[0]
+    
+    def add_shapes(self, rows: List[tuple]) -> List[QModelIndex]:
+        """(shape_id, file_name, extension, topology_rows) satırlarını tek ekleme ile ekle"""
+        if not rows:
+            return []
+        
+        items = []
+        for shape_id, file_name, extension, topology_rows in rows:
+            item = _TreeNode((file_name, extension, "Yüklendi"), shape_id, self._root)
+            
+            if topology_rows is not None:
+                topo_node = _TreeNode(("Topology",), parent=item)
+                topo_node.children = [
+                    _TreeNode((f"{key}: {value}",), parent=topo_node)
+                    for key, value in topology_rows
+                ]
+                item.children.append(topo_node)
+            
+            items.append(item)
+            self._items[shape_id] = item
+        
+        first = len(self._root.children)
+        self.beginInsertRows(QModelIndex(), first, first + len(items) - 1)
+        self._root.children.extend(items)
+        self.endInsertRows()
+        
+        return [self.index(row, 0) for row in range(first, first + len(items))]
+    
+    def remove_shape(self, shape_id: str) -> bool:
+        """Parçayı ağaçtan kaldır"""
+        node = self._items.pop(shape_id, None)
+        if node is None:
+            return False
+        
+        # Düğüm haritadan bulunur; satır numarası kimlik karşılaştırmalı C taramasıyla alınır
+        row = self._root.children.index(node)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._root.children[row]
+        self.endRemoveRows()
+        return True
 
 class MainWindow(QMainWindow):
     """Ana uygulama penceresi"""
@@ -66,16 +356,59 @@ class MainWindow(QMainWindow):
         self.logger = logger
         
         # Uygulama durumu
-        self.current_shapes = {}  # shape_id -> shape_data
+        self.current_shapes: Dict[str, ShapeRecord] = {}  # shape_id -> ShapeRecord
+        self._bvh = AABBTree()  # bounding box'ı bilinen parçalar (çakışma geniş fazı)
+        self._collision_executor = None  # dar faz için kalıcı thread havuzu (ilk kullanımda)
+        self.collision_worker = None
+        self._deferred_forget = []  # çakışma kontrolü sürerken kaldırılan shape'ler
         self.selected_shapes = set()
         self.assembly_engine = None
         self.import_worker = None
+        self._active_workers = set()  # çalışan import görevleri (GC'den korunur)
+        
+        # Son dosyaların varlık bilgisi (arka planda doldurulur)
+        self._recent_files_valid = {}
+        self._recent_files_check = None
+        
+        # Son dosya dizinlerindeki değişiklikler önbelleği geçersiz kılar
+        self._fs_watcher = QFileSystemWatcher(self)
+        self._fs_watcher.directoryChanged.connect(self._on_recent_dir_changed)
+        
+        # Combo değişikliklerini birleştir (art arda gelenlerden yalnız sonuncusu işlenir)
+        self._combo_debounce = QTimer(self)
+        self._combo_debounce.setSingleShot(True)
+        self._combo_debounce.setInterval(50)
+        self._combo_debounce.timeout.connect(self._apply_combo_change)
+        
+        # Art arda kaldırmalarda combo/status yenilemesi tek sefere indirilir
+        self._combo_update_pending = False
+        
+        # Biten import'lar bir sonraki event loop turunda toplu işlenir
+        self._pending_finished = []  # (shape, metadata, analysis)
+        self._import_flush_timer = QTimer(self)
+        self._import_flush_timer.setSingleShot(True)
+        self._import_flush_timer.setInterval(0)
+        self._import_flush_timer.timeout.connect(self._flush_imports)
         
         # UI bileşenleri
         self.viewer = None
         self.toolbar = None
         self.status_bar = None
         self.dock_widgets = {}
+        self.model_tree = None
+        self._pending_tree_rows = []  # ağaç gizliyken eklenen parçalar
+        self.assembly_button = None
+        self.assembly_action = None
+        self.base_part_combo = None
+        self.attach_part_combo = None
+        
+        # Model ağacı context menu'sü bir kez kurulur; hedef parça gösterimde atanır
+        self._ctx_item = None  # sağ tıklanan parçanın shape_id'si
+        self._ctx_menu = QMenu(self)
+        self._info_action = self._ctx_menu.addAction("Bilgileri Göster")
+        self._info_action.triggered.connect(self._ctx_info)
+        self._remove_action = self._ctx_menu.addAction("Kaldır")
+        self._remove_action.triggered.connect(self._ctx_remove)
         
         # Setup UI
         self._setup_ui()
@@ -159,15 +492,22 @@ class MainWindow(QMainWindow):
         self.assembly_panel = self._create_assembly_panel()
         tab_widget.addTab(self.assembly_panel, "Montaj")
         
+        # Model ağacı gizliyken biriken parçalar sekme açılınca eklenir
+        tab_widget.currentChanged.connect(self._flush_pending_tree_rows)
+        
         layout.addWidget(tab_widget)
         
         return panel
     
-    def _create_model_tree(self) -> QTreeWidget:
+    def _create_model_tree(self) -> QTreeView:
         """Model ağacı widget'ını oluştur"""
-        tree = QTreeWidget()
-        tree.setHeaderLabels(["Model", "Tür", "Durum"])
+        self.tree_model = ShapeTreeModel(self)
+        
+        tree = QTreeView()
+        tree.setModel(self.tree_model)
         tree.setAlternatingRowColors(True)
+        # Satır yükseklikleri tek tek ölçülmez
+        tree.setUniformRowHeights(True)
         tree.setRootIsDecorated(True)
         
         # Context menu için
@@ -214,9 +554,10 @@ class MainWindow(QMainWindow):
         results_group = QGroupBox("Montaj Sonuçları")
         results_layout = QVBoxLayout(results_group)
         
-        self.assembly_results = QTextEdit()
+        self.assembly_results = QPlainTextEdit()
         self.assembly_results.setMaximumHeight(150)
         self.assembly_results.setReadOnly(True)
+        self.assembly_results.setMaximumBlockCount(500)
         results_layout.addWidget(self.assembly_results)
         
         layout.addWidget(results_group)
@@ -227,32 +568,33 @@ class MainWindow(QMainWindow):
     def _setup_menu_bar(self):
         """Menu bar'ı kur"""
         menubar = self.menuBar()
+        shortcuts = _ensure_shortcuts()
         
         # Dosya menüsü
         file_menu = menubar.addMenu("Dosya")
         
         # Dosya aç
         open_action = QAction("Aç...", self)
-        open_action.setShortcut(QKeySequence(Shortcuts.OPEN))
+        open_action.setShortcut(shortcuts["OPEN"])
         open_action.setToolTip("CAD dosyası aç")
         open_action.triggered.connect(self.open_file)
         file_menu.addAction(open_action)
         
         # Son dosyalar
-        recent_menu = file_menu.addMenu("Son Dosyalar")
-        self._update_recent_files_menu(recent_menu)
+        self.recent_menu = file_menu.addMenu("Son Dosyalar")
+        self._update_recent_files_menu(self.recent_menu)
         
         file_menu.addSeparator()
         
         # Kaydet
         save_action = QAction("Kaydet", self)
-        save_action.setShortcut(QKeySequence(Shortcuts.SAVE))
+        save_action.setShortcut(shortcuts["SAVE"])
         save_action.setEnabled(False)  # Şimdilik devre dışı
         file_menu.addAction(save_action)
         
         # Farklı kaydet
         save_as_action = QAction("Farklı Kaydet...", self)
-        save_as_action.setShortcut(QKeySequence(Shortcuts.SAVE_AS))
+        save_as_action.setShortcut(shortcuts["SAVE_AS"])
         save_as_action.setEnabled(False)  # Şimdilik devre dışı
         file_menu.addAction(save_as_action)
         
@@ -260,7 +602,7 @@ class MainWindow(QMainWindow):
         
         # Çıkış
         exit_action = QAction("Çıkış", self)
-        exit_action.setShortcut(QKeySequence(Shortcuts.EXIT))
+        exit_action.setShortcut(shortcuts["EXIT"])
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
         
@@ -269,7 +611,7 @@ class MainWindow(QMainWindow):
         
         # Fit All
         fit_all_action = QAction("Hepsini Sığdır", self)
-        fit_all_action.setShortcut(QKeySequence(Shortcuts.FIT_ALL))
+        fit_all_action.setShortcut(shortcuts["FIT_ALL"])
         fit_all_action.triggered.connect(self.fit_all)
         view_menu.addAction(fit_all_action)
         
@@ -286,21 +628,27 @@ class MainWindow(QMainWindow):
             ("İzometrik", "isometric")
         ]
         
+        # Tek grup ve tek slot; yön action.data() içinde taşınır
+        self.view_direction_group = QActionGroup(self)
+        self.view_direction_group.setExclusive(True)
         for name, direction in view_directions:
-            action = QAction(name, self)
-            action.triggered.connect(lambda checked, d=direction: self.set_view_direction(d))
+            action = self.view_direction_group.addAction(name)
+            action.setData(direction)
+            action.setCheckable(True)
             view_menu.addAction(action)
+        self.view_direction_group.triggered.connect(self._on_view_direction_action)
         
         # Montaj menüsü
         assembly_menu = menubar.addMenu("Montaj")
         
         assembly_action = QAction("Montaj Yap", self)
-        assembly_action.setShortcut(QKeySequence(Shortcuts.START_ASSEMBLY))
+        assembly_action.setShortcut(shortcuts["START_ASSEMBLY"])
         assembly_action.triggered.connect(self.start_assembly)
         assembly_menu.addAction(assembly_action)
+        self.assembly_action = assembly_action
         
         collision_action = QAction("Çakışma Kontrolü", self)
-        collision_action.setShortcut(QKeySequence(Shortcuts.CHECK_COLLISION))
+        collision_action.setShortcut(shortcuts["CHECK_COLLISION"])
         collision_action.triggered.connect(self.check_collisions)
         assembly_menu.addAction(collision_action)
         
@@ -308,7 +656,7 @@ class MainWindow(QMainWindow):
         tools_menu = menubar.addMenu("Araçlar")
         
         settings_action = QAction("Ayarlar...", self)
-        settings_action.setShortcut(QKeySequence(Shortcuts.SETTINGS))
+        settings_action.setShortcut(shortcuts["SETTINGS"])
         settings_action.triggered.connect(self.show_settings)
         tools_menu.addAction(settings_action)
         
@@ -316,7 +664,7 @@ class MainWindow(QMainWindow):
         help_menu = menubar.addMenu("Yardım")
         
         help_action = QAction("Yardım", self)
-        help_action.setShortcut(QKeySequence(Shortcuts.HELP))
+        help_action.setShortcut(shortcuts["HELP"])
         help_action.triggered.connect(self.show_help)
         help_menu.addAction(help_action)
         
@@ -339,21 +687,38 @@ class MainWindow(QMainWindow):
         self.progress_bar.setMaximumWidth(200)
         self.status_bar.addPermanentWidget(self.progress_bar)
         
+        self.cancel_button = QPushButton("İptal")
+        self.cancel_button.setToolTip("Çalışan işlemi iptal et")
+        self.cancel_button.setVisible(False)
+        self.cancel_button.clicked.connect(self._cancel_running_tasks)
+        self.status_bar.addPermanentWidget(self.cancel_button)
+        
         # Sağ taraf - shape sayısı
         self.shape_count_label = QLabel("Parça: 0")
         self.status_bar.addPermanentWidget(self.shape_count_label)
     
     def _setup_dock_widgets(self):
         """Dock widget'ları kur"""
-        # Log widget
+        # Log widget (ilk gösterimde oluşturulur)
         log_dock = QDockWidget("Log", self)
-        self.log_widget = LogWidget()
-        log_dock.setWidget(self.log_widget)
+        self.log_widget = None
         self.addDockWidget(Qt.BottomDockWidgetArea, log_dock)
         self.dock_widgets["log"] = log_dock
         
         # İlk başta gizli
         log_dock.hide()
+        log_dock.visibilityChanged.connect(self._on_log_dock_visibility_changed)
+    
+    @pyqtSlot(bool)
+    def _on_log_dock_visibility_changed(self, visible: bool):
+        """Log dock ilk kez görünür olduğunda LogWidget'ı oluştur"""
+        if not visible or self.log_widget is not None:
+            return
+        
+        log_dock = self.dock_widgets["log"]
+        log_dock.visibilityChanged.disconnect(self._on_log_dock_visibility_changed)
+        self.log_widget = LogWidget()
+        log_dock.setWidget(self.log_widget)
     
     def _setup_connections(self):
         """Signal/slot bağlantılarını kur"""
@@ -381,18 +746,20 @@ class MainWindow(QMainWindow):
                 self.logger.info("Toolbar sinyalleri bağlandı")
             
             # Model tree
-            if hasattr(self, 'model_tree'):
-                self.model_tree.itemSelectionChanged.connect(self._on_tree_selection_changed)
+            if self.model_tree is not None:
+                self.model_tree.selectionModel().selectionChanged.connect(
+                    self._on_tree_selection_changed
+                )
             
             # Montaj kontrolleri
-            if hasattr(self, 'assembly_button'):
+            if self.assembly_button is not None:
                 self.assembly_button.clicked.connect(self.start_assembly)
             
             # Combo box değişiklikleri
-            if hasattr(self, 'base_part_combo'):
-                self.base_part_combo.currentTextChanged.connect(self._on_base_part_changed)
-            if hasattr(self, 'attach_part_combo'):
-                self.attach_part_combo.currentTextChanged.connect(self._on_attach_part_changed)
+            if self.base_part_combo is not None:
+                self.base_part_combo.currentIndexChanged.connect(self._schedule_combo_change)
+            if self.attach_part_combo is not None:
+                self.attach_part_combo.currentIndexChanged.connect(self._schedule_combo_change)
             
             self.logger.debug("Signal/slot bağlantıları kuruldu")
             
@@ -412,7 +779,8 @@ class MainWindow(QMainWindow):
         self.logger.info(f"Display mode değiştirildi: {mode}")
         
         try:
-            if not self.viewer or not hasattr(self.viewer, '_context'):
+            ctx = getattr(self.viewer, '_context', None) if self.viewer else None
+            if ctx is None:
                 return
             
             # Mode'a göre display mode ayarla
@@ -422,17 +790,17 @@ class MainWindow(QMainWindow):
             elif mode.lower() == "hidden line":
                 display_mode = 2  # Hidden line (eğer destekleniyorsa)
             
-            # Tüm shape'lerin display mode'unu değiştir
-            for shape_id, shape_data in self.current_shapes.items():
+            # Tüm shape'lerin display mode'unu değiştir (ara viewer güncellemesi yok)
+            for shape_id, record in self.current_shapes.items():
                 try:
-                    ais_shape = shape_data.get("ais_shape")
+                    ais_shape = record.ais_shape
                     if ais_shape:
-                        self.viewer._context.SetDisplayMode(ais_shape, display_mode, True)
+                        ctx.SetDisplayMode(ais_shape, display_mode, False)
                 except Exception as e:
                     self.logger.warning(f"Shape {shape_id} display mode hatası: {e}")
             
-            # Viewer'ı güncelle
-            self.viewer._context.UpdateCurrentViewer()
+            # Viewer'ı tek seferde güncelle
+            ctx.UpdateCurrentViewer()
             self.logger.info(f"Display mode güncellendi: {mode}")
             
         except Exception as e:
@@ -460,7 +828,9 @@ class MainWindow(QMainWindow):
         """Son dosyalar menüsünü güncelle"""
         menu.clear()
         
-        recent_files = self.config.get_recent_files()
+        # Varlık kontrolü UI thread'de yapılmaz; önbellekteki sonuç okunur
+        recent_files = self.config.get("files.recent_files", [])[:10]  # Son 10 dosya
+        recent_files = [p for p in recent_files if self._recent_files_valid.get(p, True)]
         
         if not recent_files:
             no_files_action = QAction("Son dosya yok", self)
@@ -468,13 +838,49 @@ class MainWindow(QMainWindow):
             menu.addAction(no_files_action)
             return
         
-        for file_path in recent_files[:10]:  # Son 10 dosya
-            if os.path.exists(file_path):
-                file_name = os.path.basename(file_path)
-                action = QAction(file_name, self)
-                action.setToolTip(file_path)
-                action.triggered.connect(lambda checked, path=file_path: self.open_file(path))
-                menu.addAction(action)
+        # Dizinleri izlemeye al (zaten izlenenler tekrar eklenmez)
+        watched = set(self._fs_watcher.directories())
+        new_dirs = {os.path.dirname(p) for p in recent_files} - watched
+        new_dirs.discard("")
+        if new_dirs:
+            self._fs_watcher.addPaths(sorted(new_dirs))
+        
+        unchecked = [p for p in recent_files if p not in self._recent_files_valid]
+        if unchecked and self._recent_files_check is None:
+            self._recent_files_check = _RecentFilesCheck(unchecked)
+            self._recent_files_check.signals.checked.connect(self._on_recent_files_checked)
+            QThreadPool.globalInstance().start(self._recent_files_check)
+        
+        for file_path in recent_files:
+            file_name = os.path.basename(file_path)
+            action = QAction(file_name, self)
+            action.setToolTip(file_path)
+            action.triggered.connect(partial(_invoke, partial(self.open_file, file_path)))
+            menu.addAction(action)
+    
+    @pyqtSlot(dict)
+    def _on_recent_files_checked(self, result: Dict[str, bool]):
+        """Arka plan varlık kontrolü bittiğinde menüyü güncelle"""
+        self._recent_files_check = None
+        
+        changed = any(self._recent_files_valid.get(p, True) != valid for p, valid in result.items())
+        self._recent_files_valid.update(result)
+        
+        # Kontrol sürerken geçersiz kılınan girdiler de yeniden kontrol edilsin
+        recent_files = self.config.get("files.recent_files", [])[:10]
+        if changed or any(p not in self._recent_files_valid for p in recent_files):
+            self._update_recent_files_menu(self.recent_menu)
+    
+    @pyqtSlot(str)
+    def _on_recent_dir_changed(self, directory: str):
+        """İzlenen dizin değişince o dizindeki son dosyaların önbelleğini sil"""
+        stale = [p for p in self._recent_files_valid if os.path.dirname(p) == directory]
+        if not stale:
+            return
+        
+        for file_path in stale:
+            del self._recent_files_valid[file_path]
+        self._update_recent_files_menu(self.recent_menu)
     
     # Slot fonksiyonları
     @pyqtSlot()
@@ -498,14 +904,20 @@ class MainWindow(QMainWindow):
             self.logger.info(f"Dosya açılıyor: {file_path}")
             
             # Progress göster
-            self._show_progress("Dosya yükleniyor...", True)
+            self._show_progress("Dosya yükleniyor...")
+            self.cancel_button.setVisible(True)
             
-            # Worker thread'de import yap
-            self.import_worker = ImportWorker(file_path, self.config)
-            self.import_worker.import_finished.connect(self._on_import_finished)
-            self.import_worker.import_progress.connect(self._update_progress)
-            self.import_worker.import_error.connect(self._on_import_error)
-            self.import_worker.start()
+            # Thread pool'da import yap
+            worker = ImportWorker(file_path, self.config)
+            worker.signals.import_finished.connect(self._on_import_finished)
+            worker.signals.import_progress.connect(self._update_progress)
+            worker.signals.import_error.connect(self._on_import_error)
+            worker.signals.import_cancelled.connect(self._on_import_cancelled)
+            worker.signals.finished.connect(self._on_import_worker_done)
+            
+            self._active_workers.add(worker)
+            self.import_worker = worker
+            QThreadPool.globalInstance().start(worker)
             
         except Exception as e:
             self.logger.error(f"Dosya açma hatası: {e}")
@@ -514,49 +926,105 @@ class MainWindow(QMainWindow):
     
     @pyqtSlot(object, dict, dict)
     def _on_import_finished(self, shape, metadata, analysis):
-        """Import tamamlandığında"""
+        """Import tamamlandığında (sonuçlar biriktirilip tek seferde işlenir)"""
+        self._pending_finished.append((shape, metadata, analysis))
+        self._import_flush_timer.start()
+    
+    @pyqtSlot()
+    def _flush_imports(self):
+        """Biriken import sonuçlarını tek GUI güncellemesi ile işle"""
+        pending, self._pending_finished = self._pending_finished, []
+        if not pending:
+            return
+        
         try:
             self._hide_progress()
             
-            # Shape'i viewer'a ekle
-            shape_id = self.viewer.add_shape(shape)
+            # Shape'leri viewer'a ekle (tek viewer güncellemesi)
+            shape_ids = self.viewer.add_shapes_batch([shape for shape, _, _ in pending])
             
-            if shape_id:
-                # Shape verilerini sakla
-                self.current_shapes[shape_id] = {
-                    "shape": shape,
-                    "metadata": metadata,
-                    "analysis": analysis,
-                    "file_path": metadata.get("file_path", "")
-                }
+            loaded = []
+            for (shape, metadata, analysis), shape_id in zip(pending, shape_ids):
+                if not shape_id:
+                    self._show_error("Import Hatası", "Shape viewer'a eklenemedi")
+                    continue
                 
-                # Model ağacına ekle
-                self._add_shape_to_tree(shape_id, metadata)
-                
-                # Combo box'ları güncelle
-                self._update_assembly_combos()
+                # Shape verilerini sakla
+                file_path = metadata.get("file_path", "")
+                record = ShapeRecord(
+                    shape, metadata, analysis,
+                    file_path=file_path,
+                    display_name=os.path.basename(file_path) or f"Shape {shape_id}",
+                    ais_shape=self.viewer.shapes.get(shape_id, {}).get("ais_shape"),
+                    aabb=_shape_aabb(analysis)
+                )
+                self.current_shapes[shape_id] = record
+                if record.aabb:
+                    self._bvh.insert(shape_id, record.aabb)
                 
-                # Viewer'da fit all
-                self.viewer.fit_all()
+                # Model ağacı kuyruğuna ekle
+                self._add_shape_to_tree(shape_id, metadata, flush=False)
                 
                 # Son dosyalar listesine ekle
-                file_path = metadata.get("file_path")
                 if file_path:
                     self.config.add_recent_file(file_path)
-                
-                # Status güncelle
-                self._update_status()
+                    self._recent_files_valid[file_path] = True
                 
                 self.logger.info(f"Dosya başarıyla yüklendi: {file_path}")
-                self.status_label.setText(f"Dosya yüklendi: {os.path.basename(file_path)}")
-                
+                loaded.append(record)
+            
+            if not loaded:
+                return
+            
+            # Ağaç, combo'lar, menü ve status bir kez güncellenir
+            self._flush_pending_tree_rows()
+            self._update_assembly_combos()
+            self._update_recent_files_menu(self.recent_menu)
+            self._update_status()
+            
+            if len(loaded) == 1:
+                self.status_label.setText(f"Dosya yüklendi: {loaded[0].display_name}")
             else:
-                self._show_error("Import Hatası", "Shape viewer'a eklenemedi")
+                self.status_label.setText(f"{len(loaded)} dosya yüklendi")
                 
         except Exception as e:
             self.logger.error(f"Import sonucu işleme hatası: {e}")
             self._show_error("Import Hatası", str(e))
     
+    @pyqtSlot()
+    def _on_import_worker_done(self):
+        """Biten import görevini bırak"""
+        signals = self.sender()
+        self._active_workers = {w for w in self._active_workers if w.signals is not signals}
+        if self.import_worker is not None and self.import_worker.signals is signals:
+            self.import_worker = None
+        
+        # Son görev bittiyse progress ve iptal butonu gizlenir
+        self._hide_progress()
+    
+    @pyqtSlot()
+    def _cancel_running_tasks(self):
+        """İptal butonu: çalışan import ve çakışma görevlerini iptal et"""
+        if self._active_workers:
+            self._cancel_imports()
+        if self.collision_worker is not None:
+            self.collision_worker.cancel()
+            self.status_label.setText("Çakışma kontrolü iptal ediliyor...")
+    
+    @pyqtSlot()
+    def _cancel_imports(self):
+        """Çalışan import görevlerini iptal et"""
+        for worker in self._active_workers:
+            worker.cancel()
+        self.status_label.setText("Dosya yükleme iptal ediliyor...")
+    
+    @pyqtSlot()
+    def _on_import_cancelled(self):
+        """Import iptal edildiğinde"""
+        self._hide_progress()
+        self.logger.info("Dosya yükleme iptal edildi")
+        self.status_label.setText("Dosya yükleme iptal edildi")
+    
     @pyqtSlot(str)
     def _on_import_error(self, error_message: str):
         """Import hatası"""
@@ -595,66 +1063,97 @@ class MainWindow(QMainWindow):
     @pyqtSlot()
     def _on_tree_selection_changed(self):
         """Model ağacı seçimi değiştiğinde"""
-        selected_items = self.model_tree.selectedItems()
+        selected_rows = self.model_tree.selectionModel().selectedRows()
         
-        if selected_items:
-            item = selected_items[0]
-            shape_id = item.data(0, Qt.UserRole)
+        if selected_rows:
+            shape_id = selected_rows[0].data(Qt.UserRole)
             
             if shape_id and shape_id in self.current_shapes:
                 # Viewer'da seç
                 self.viewer.select_shape(shape_id)
                 
                 # Property panel güncelle
-                shape_data = self.current_shapes[shape_id]
-                self.property_panel.update_properties(shape_data)
+                self.property_panel.update_properties(self.current_shapes[shape_id].as_dict())
     
-    def _add_shape_to_tree(self, shape_id: str, metadata: Dict[str, Any]):
-        """Shape'i model ağacına ekle"""
+    def _add_shape_to_tree(self, shape_id: str, metadata: Dict[str, Any], flush: bool = True):
+        """Shape'i model ağacına ekle (flush=False ise sadece kuyruğa al)"""
         try:
             file_name = os.path.basename(metadata.get("file_path", "Bilinmeyen"))
             
-            item = QTreeWidgetItem(self.model_tree)
-            item.setText(0, file_name)
-            item.setText(1, metadata.get("file_extension", "").upper())
-            item.setText(2, "Yüklendi")
-            item.setData(0, Qt.UserRole, shape_id)
-            
-            # Analiz varsa alt öğeler ekle
-            analysis = self.current_shapes[shape_id].get("analysis", {})
-            basic_geom = analysis.get("basic_geometry", {})
+            # Analiz varsa topology alt satırları (import görevinde hazırlanır)
+            analysis = self.current_shapes[shape_id].analysis or {}
+            topology_rows = analysis.get("_topology_rows")
             
-            if basic_geom:
-                topology = basic_geom.get("topology", {})
-                
-                # Topology bilgileri
-                topo_item = QTreeWidgetItem(item)
-                topo_item.setText(0, "Topology")
-                
-                for key, value in topology.items():
-                    if isinstance(value, int) and value > 0:
-                        child_item = QTreeWidgetItem(topo_item)
-                        child_item.setText(0, f"{key}: {value}")
+            self._pending_tree_rows.append(
+                (shape_id, file_name, metadata.get("file_extension", "").upper(), topology_rows)
+            )
             
-            self.model_tree.expandAll()
+            # Ağaç görünmüyorsa sekme açılana kadar beklet
+            if flush and self.model_tree.isVisible():
+                self._flush_pending_tree_rows()
             
         except Exception as e:
             self.logger.warning(f"Model ağacına ekleme hatası: {e}")
     
+    @pyqtSlot()
+    def _flush_pending_tree_rows(self):
+        """Bekleyen parçaları model ağacına ekle"""
+        if not self._pending_tree_rows or not self.model_tree.isVisible():
+            return
+        
+        pending, self._pending_tree_rows = self._pending_tree_rows, []
+        
+        # Ekleme ve açma tek repaint ile çizilsin
+        self.model_tree.setUpdatesEnabled(False)
+        try:
+            # Sadece yeni parçaların alt ağacını aç; önceki parçalar yeniden gezilmez
+            for index in self.tree_model.add_shapes(pending):
+                self.model_tree.expandRecursively(index)
+        except Exception as e:
+            self.logger.warning(f"Model ağacına ekleme hatası: {e}")
+        finally:
+            self.model_tree.setUpdatesEnabled(True)
+    
     def _update_assembly_combos(self):
         """Montaj combo box'larını güncelle"""
+        combos = (self.base_part_combo, self.attach_part_combo)
+        
+        # Doldururken her addItem için değişiklik sinyali tetiklenmesin
+        for combo in combos:
+            combo.blockSignals(True)
+        
         try:
-            self.base_part_combo.clear()
-            self.attach_part_combo.clear()
+            for combo in combos:
+                combo.clear()
             
-            for shape_id, shape_data in self.current_shapes.items():
-                file_name = os.path.basename(shape_data["metadata"].get("file_path", f"Shape {shape_id}"))
+            for shape_id, record in self.current_shapes.items():
+                display_name = record.display_name or f"Shape {shape_id}"
                 
-                self.base_part_combo.addItem(file_name, shape_id)
-                self.attach_part_combo.addItem(file_name, shape_id)
+                self.base_part_combo.addItem(display_name, shape_id)
+                self.attach_part_combo.addItem(display_name, shape_id)
                 
         except Exception as e:
             self.logger.warning(f"Assembly combo güncelleme hatası: {e}")
+        finally:
+            for combo in combos:
+                combo.blockSignals(False)
+        
+        # Toplu güncellemeden sonra tek bildirim
+        self._combo_debounce.start()
+    
+    def _schedule_combo_update(self):
+        """Combo ve status yenilemesini bir sonraki event loop turuna ertele"""
+        if self._combo_update_pending:
+            return
+        self._combo_update_pending = True
+        QTimer.singleShot(0, self._do_combo_update)
+    
+    @pyqtSlot()
+    def _do_combo_update(self):
+        """Bekleyen combo ve status yenilemesini uygula"""
+        self._combo_update_pending = False
+        self._update_assembly_combos()
+        self._update_status()
     
     def _update_status(self):
         """Status bar'ı güncelle"""
@@ -672,10 +1171,14 @@ class MainWindow(QMainWindow):
         self.status_label.setText(message)
     
     def _hide_progress(self):
-        """Progress gizle"""
-        self.progress_bar.setVisible(False)
+        """Progress gizle (başka görev çalışıyorsa progress ve iptal butonu açık kalır)"""
         self.progress_bar.setRange(0, 100)
+        if self._active_workers or self.collision_worker is not None:
+            return
+        
+        self.progress_bar.setVisible(False)
         self.progress_bar.setValue(0)
+        self.cancel_button.setVisible(False)
     
     def _show_error(self, title: str, message: str):
         """Hata mesajı göster"""
@@ -691,6 +1194,11 @@ class MainWindow(QMainWindow):
         if self.viewer:
             self.viewer.fit_all()
     
+    @pyqtSlot(QAction)
+    def _on_view_direction_action(self, action: QAction):
+        """Görünüm menüsünden yön seçildiğinde"""
+        self.set_view_direction(action.data())
+    
     def set_view_direction(self, direction: str):
         """Görünüm yönü ayarla"""
         if self.viewer:
@@ -703,6 +1211,11 @@ class MainWindow(QMainWindow):
                 self._show_error("Montaj Hatası", "Montaj motoru hazır değil")
                 return
             
+            # Çakışma kontrolü aynı detector'ı worker thread'lerinden kullanıyor
+            if self.collision_worker is not None:
+                self.status_label.setText("Çakışma kontrolü bitmeden montaj yapılamaz")
+                return
+            
             # Seçili parçaları al
             base_shape_id = self.base_part_combo.currentData()
             attach_shape_id = self.attach_part_combo.currentData()
@@ -715,8 +1228,8 @@ class MainWindow(QMainWindow):
                 self._show_error("Montaj Hatası", "Aynı parçayı seçemezsiniz")
                 return
             
-            base_shape = self.current_shapes[base_shape_id]["shape"]
-            attach_shape = self.current_shapes[attach_shape_id]["shape"]
+            base_shape = self.current_shapes[base_shape_id].shape
+            attach_shape = self.current_shapes[attach_shape_id].shape
             
             # Tolerans al
             tolerance = self.tolerance_spin.value()
@@ -733,29 +1246,38 @@ class MainWindow(QMainWindow):
             
             if result:
                 # Başarılı montaj
-                self.assembly_results.append("✓ Montaj başarılı!")
-                self.assembly_results.append(f"Ana parça: {self.base_part_combo.currentText()}")
-                self.assembly_results.append(f"Eklenen parça: {self.attach_part_combo.currentText()}")
-                self.assembly_results.append(f"Tolerans: {tolerance} mm")
-                self.assembly_results.append("-" * 40)
+                self.assembly_results.appendPlainText("\n".join([
+                    "✓ Montaj başarılı!",
+                    f"Ana parça: {self.base_part_combo.currentText()}",
+                    f"Eklenen parça: {self.attach_part_combo.currentText()}",
+                    f"Tolerans: {tolerance} mm",
+                    "-" * 40
+                ]))
                 
                 # Sonuç shape'i viewer'a ekle
                 result_id = self.viewer.add_shape(result, color=(0.2, 0.8, 0.2))
                 if result_id:
-                    self.current_shapes[result_id] = {
-                        "shape": result,
-                        "metadata": {"type": "assembly_result"},
-                        "analysis": {},
-                        "file_path": ""
-                    }
+                    # Bounding box bir kez hesaplanır; çakışma kontrolünde OCC çağrısı yapılmaz
+                    aabb = self.assembly_engine.collision_detector.get_aabb(result)
+                    record = ShapeRecord(
+                        result, {"type": "assembly_result"}, {},
+                        display_name=f"Shape {result_id}",
+                        ais_shape=self.viewer.shapes.get(result_id, {}).get("ais_shape"),
+                        aabb=conservative_aabb(aabb) if aabb else None
+                    )
+                    self.current_shapes[result_id] = record
+                    if record.aabb:
+                        self._bvh.insert(result_id, record.aabb)
                 
                 self._update_status()
                 self.logger.info("Montaj başarılı")
                 
             else:
-                self.assembly_results.append("✗ Montaj başarısız!")
-                self.assembly_results.append("Uygun bağlantı noktası bulunamadı.")
-                self.assembly_results.append("-" * 40)
+                self.assembly_results.appendPlainText("\n".join([
+                    "✗ Montaj başarısız!",
+                    "Uygun bağlantı noktası bulunamadı.",
+                    "-" * 40
+                ]))
                 self.logger.warning("Montaj başarısız")
                 
         except Exception as e:
@@ -763,7 +1285,7 @@ class MainWindow(QMainWindow):
             error_msg = f"Montaj hatası: {str(e)}"
             self.logger.error(error_msg)
             self._show_error("Montaj Hatası", error_msg)
-            self.assembly_results.append(f"✗ Hata: {str(e)}")
+            self.assembly_results.appendPlainText(f"✗ Hata: {str(e)}")
     
     def check_collisions(self):
         """Çakışma kontrolü yap"""
@@ -776,31 +1298,112 @@ class MainWindow(QMainWindow):
                 self._show_info("Çakışma Kontrolü", "En az 2 parça gerekli")
                 return
             
+            if self.collision_worker is not None:
+                self.status_label.setText("Çakışma kontrolü zaten çalışıyor")
+                return
+            
             self.logger.info("Çakışma kontrolü başlatılıyor")
             
-            shapes = list(self.current_shapes.values())
-            collision_count = 0
+            shape_ids = list(self.current_shapes)
+            shapes = [self.current_shapes[shape_id] for shape_id in shape_ids]
+            order = {shape_id: i for i, shape_id in enumerate(shape_ids)}
+            detector = self.assembly_engine.collision_detector
+            margin = getattr(detector, "touch_tolerance", 0.0)
+            
+            # Geniş faz: tüm parçalar için tek toplu BVH sorgusu.
+            # Bounding box'ı bilinmeyen parçalar herkesle kontrol edilir.
+            known = [i for i, record in enumerate(shapes) if record.aabb]
+            batch = self._bvh.query_batch([shapes[i].aabb for i in known], margin)
+            
+            hits = [None] * len(shapes)
+            for i, others in zip(known, batch):
+                hits[i] = [order[other] for other in others if order[other] > i]
+            for i, record in enumerate(shapes):
+                if not record.aabb:
+                    hits[i] = [j for j in range(len(shapes))
+                               if j != i and (shapes[j].aabb or j > i)]
+            
+            # Aday çiftler tek ayırmayla yazılır (önce say, sonra yaz)
+            candidate_pairs = pairs_from_hits(hits)
+            
+            # Dar faz: GUI thread dışında, thread havuzunda paralel
+            pairs = [(shapes[i].shape, shapes[j].shape) for i, j in candidate_pairs]
+            if not pairs:
+                self._on_collision_finished(0)
+                return
             
-            # Tüm shape çiftlerini kontrol et
-            for i in range(len(shapes)):
-                for j in range(i + 1, len(shapes)):
-                    shape1 = shapes[i]["shape"]
-                    shape2 = shapes[j]["shape"]
-                    
-                    if self.assembly_engine.collision_detector.check_collision(shape1, shape2):
-                        collision_count += 1
-            
-            if collision_count > 0:
-                self._show_info("Çakışma Kontrolü", f"{collision_count} çakışma tespit edildi!")
-            else:
-                self._show_info("Çakışma Kontrolü", "Çakışma tespit edilmedi")
+            worker = CollisionWorker(detector, pairs, self._get_collision_executor())
+            worker.signals.collision_finished.connect(self._on_collision_finished)
+            worker.signals.collision_progress.connect(self._update_progress)
+            worker.signals.collision_error.connect(self._on_collision_error)
+            worker.signals.collision_cancelled.connect(self._on_collision_cancelled)
+            worker.signals.finished.connect(self._on_collision_worker_done)
             
-            self.logger.info(f"Çakışma kontrolü tamamlandı: {collision_count} çakışma")
+            self.collision_worker = worker
+            self._set_collision_running(True)
+            self._show_progress("Çakışma kontrolü yapılıyor...")
+            self.cancel_button.setVisible(True)
+            QThreadPool.globalInstance().start(worker)
             
         except Exception as e:
-            error_msg = f"Çakışma kontrolü hatası: {str(e)}"
-            self.logger.error(error_msg)
-            self._show_error("Çakışma Kontrolü Hatası", error_msg)
+            self._on_collision_error(str(e))
+    
+    @pyqtSlot(int)
+    def _on_collision_finished(self, collision_count: int):
+        """Çakışma kontrolü tamamlandığında"""
+        self._hide_progress()
+        
+        if collision_count > 0:
+            self._show_info("Çakışma Kontrolü", f"{collision_count} çakışma tespit edildi!")
+        else:
+            self._show_info("Çakışma Kontrolü", "Çakışma tespit edilmedi")
+        
+        self.logger.info(f"Çakışma kontrolü tamamlandı: {collision_count} çakışma")
+    
+    @pyqtSlot(str)
+    def _on_collision_error(self, error_message: str):
+        """Çakışma kontrolü hatası"""
+        self._hide_progress()
+        error_msg = f"Çakışma kontrolü hatası: {error_message}"
+        self.logger.error(error_msg)
+        self._show_error("Çakışma Kontrolü Hatası", error_msg)
+    
+    @pyqtSlot()
+    def _on_collision_cancelled(self):
+        """Çakışma kontrolü iptal edildiğinde"""
+        self._hide_progress()
+        self.logger.info("Çakışma kontrolü iptal edildi")
+        self.status_label.setText("Çakışma kontrolü iptal edildi")
+    
+    @pyqtSlot()
+    def _on_collision_worker_done(self):
+        """Biten çakışma görevini bırak"""
+        self.collision_worker = None
+        
+        # Kontrol sürerken kaldırılan shape'lerin bounding box'ları artık silinebilir
+        deferred, self._deferred_forget = self._deferred_forget, []
+        if self.assembly_engine:
+            for shape in deferred:
+                self.assembly_engine.collision_detector.forget_shape(shape)
+        
+        self._set_collision_running(False)
+    
+    def _set_collision_running(self, running: bool):
+        """Çakışma kontrolü sürerken montaj ve kaldırma işlemlerini kapat"""
+        for control in (self.assembly_button, self.assembly_action, self._remove_action):
+            if control is not None:
+                control.setEnabled(not running)
+        
+        if not running:
+            self._hide_progress()
+    
+    def _get_collision_executor(self) -> ThreadPoolExecutor:
+        """Dar faz thread havuzunu al (her tıklamada thread başlatılmaz)"""
+        if self._collision_executor is None:
+            self._collision_executor = ThreadPoolExecutor(
+                max_workers=os.cpu_count() or 1, thread_name_prefix="collision"
+            )
+        return self._collision_executor
     
     @pyqtSlot()
     def show_settings(self):
@@ -838,51 +1441,67 @@ Mouse Kontrolleri:
     
     def _show_tree_context_menu(self, position):
         """Model ağacı context menu"""
-        item = self.model_tree.itemAt(position)
-        if not item:
+        shape_id = self.model_tree.indexAt(position).data(Qt.UserRole)
+        if not shape_id:
             return
         
-        menu = QMenu(self)
-        
-        # Bilgileri göster
-        info_action = QAction("Bilgileri Göster", self)
-        info_action.triggered.connect(lambda: self._show_shape_info(item))
-        menu.addAction(info_action)
-        
-        # Kaldır
-        remove_action = QAction("Kaldır", self)
-        remove_action.triggered.connect(lambda: self._remove_shape(item))
-        menu.addAction(remove_action)
-        
-        menu.exec_(self.model_tree.mapToGlobal(position))
+        self._ctx_item = shape_id
+        self._ctx_menu.exec_(self.model_tree.mapToGlobal(position))
+    
+    @pyqtSlot()
+    def _ctx_info(self):
+        """Context menu: sağ tıklanan parçanın bilgilerini göster"""
+        self._show_shape_info(self._ctx_item)
     
-    def _show_shape_info(self, item: QTreeWidgetItem):
+    @pyqtSlot()
+    def _ctx_remove(self):
+        """Context menu: sağ tıklanan parçayı kaldır"""
+        shape_id, self._ctx_item = self._ctx_item, None
+        self._remove_shape(shape_id)
+    
+    def _show_shape_info(self, shape_id: str):
         """Shape bilgilerini göster"""
-        shape_id = item.data(0, Qt.UserRole)
         if shape_id and shape_id in self.current_shapes:
-            shape_data = self.current_shapes[shape_id]
-            dialog = FileInfoDialog(shape_data, self)
+            dialog = FileInfoDialog(self.current_shapes[shape_id].as_dict(), self)
             dialog.exec_()
     
-    def _remove_shape(self, item: QTreeWidgetItem):
+    def _remove_shape(self, shape_id: str):
         """Shape'i kaldır"""
-        shape_id = item.data(0, Qt.UserRole)
         if shape_id and shape_id in self.current_shapes:
             # Viewer'dan kaldır
             self.viewer.remove_shape(shape_id)
             
-            # Data'dan kaldır
-            del self.current_shapes[shape_id]
+            # Data'dan kaldır (bounding box önbellekleri dahil)
+            record = self.current_shapes.pop(shape_id)
+            self._bvh.remove(shape_id)
+            if self.collision_worker is not None:
+                # Worker bu shape'i hâlâ kullanıyor olabilir; silme kontrol bitince yapılır
+                self._deferred_forget.append(record.shape)
+            elif self.assembly_engine:
+                self.assembly_engine.collision_detector.forget_shape(record.shape)
             
-            # Tree'den kaldır
-            self.model_tree.takeTopLevelItem(self.model_tree.indexOfTopLevelItem(item))
+            # Tree'den (veya bekleyen eklemelerden) kaldır
+            self._pending_tree_rows = [
+                row for row in self._pending_tree_rows if row[0] != shape_id
+            ]
+            self.tree_model.remove_shape(shape_id)
             
-            # Combo'ları güncelle
-            self._update_assembly_combos()
-            self._update_status()
+            # Combo'ları ve status'u bir sonraki event loop turunda güncelle
+            self._schedule_combo_update()
             
             self.logger.info(f"Shape kaldırıldı: {shape_id}")
     
+    @pyqtSlot(int)
+    def _schedule_combo_change(self, index: int):
+        """Combo değişikliğini ertele (debounce)"""
+        self._combo_debounce.start()
+    
+    @pyqtSlot()
+    def _apply_combo_change(self):
+        """Biriken combo değişikliklerini tek seferde uygula"""
+        self._on_base_part_changed()
+        self._on_attach_part_changed()
+    
     def _on_base_part_changed(self):
         """Ana parça değiştiğinde"""
         # Attach combo'da aynı parçayı seçemeyecek şekilde güncelle
@@ -917,10 +1536,15 @@ Mouse Kontrolleri:
     def cleanup(self):
         """Temizlik işlemleri"""
         try:
-            # Worker thread'i durdur
-            if self.import_worker and self.import_worker.isRunning():
-                self.import_worker.terminate()
-                self.import_worker.wait(3000)
+            # Çalışan import ve çakışma görevlerini iptal edip bekle (pool thread'leri zorla sonlandırılamaz)
+            if self._active_workers or self.collision_worker is not None:
+                self._cancel_running_tasks()
+                QThreadPool.globalInstance().waitForDone(3000)
+            
+            # Çakışma thread havuzunu kapat
+            if self._collision_executor is not None:
+                self._collision_executor.shutdown(wait=True)
+                self._collision_executor = None
             
             # Viewer temizle
             if self.viewer:
@@ -4,6 +4,7 @@ Ana toolbar ve özel menü widget'ları
 """
 
 import logging,os
+from functools import partial
 from typing import Dict, Any, List, Optional
 from PyQt5.QtWidgets import (
     QToolBar, QAction, QToolButton, QMenu, QActionGroup,
@@ -11,14 +12,24 @@ from PyQt5.QtWidgets import (
     QSlider, QSpinBox, QCheckBox, QPushButton, 
     QButtonGroup, QFrame  # QSeparator kaldırıldı, QFrame kullanılıyor
 )
-from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QSize
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QSize, QTimer
 from PyQt5.QtGui import QIcon, QPixmap, QKeySequence
 
 from utils.constants import GUIDefaults, Shortcuts, Icons
 
+# Icon klasörü modül yüklenirken bir kez taranır (action başına stat yok)
+_ICON_DIR = "resources/icons"
+_ICON_SET = frozenset(os.listdir(_ICON_DIR)) if os.path.isdir(_ICON_DIR) else frozenset()
+
+_MOUSE_FMT = "X: %.2f, Y: %.2f, Z: %.2f"
+_FPS_FMT = "FPS: %d"
+
 class MainToolbar(QToolBar):
     """Ana toolbar sınıfı"""
     
+    _ICON_SET = _ICON_SET
+    _ICON_CACHE: Dict[str, QIcon] = {}  # icon_name -> QIcon (tüm toolbar'lar paylaşır)
+    
     # Sinyaller
     file_open_requested = pyqtSignal()
     file_save_requested = pyqtSignal()
@@ -36,6 +47,13 @@ class MainToolbar(QToolBar):
         self.actions = {}
         self.widgets = {}
         
+        # Slider sürüklenirken viewer en fazla ~60 Hz güncellenir
+        self._pending_transparency = None
+        self._transparency_timer = QTimer(self)
+        self._transparency_timer.setSingleShot(True)
+        self._transparency_timer.setInterval(16)
+        self._transparency_timer.timeout.connect(self._apply_transparency)
+        
         self._setup_toolbar()
         self.logger.debug("Ana toolbar oluşturuldu")
     
@@ -131,7 +149,7 @@ class MainToolbar(QToolBar):
         
         for name, direction in view_directions:
             action = QAction(name, self)
-            action.triggered.connect(lambda checked, d=direction: self.view_direction_changed.emit(d))
+            action.triggered.connect(partial(self._emit_view_direction, direction))
             view_menu.addAction(action)
         
         view_button.setMenu(view_menu)
@@ -193,7 +211,7 @@ class MainToolbar(QToolBar):
         
         for name, align_type in align_options:
             action = QAction(name, self)
-            action.triggered.connect(lambda checked, t=align_type: self._on_alignment_requested(t))
+            action.triggered.connect(partial(self._on_alignment_requested, align_type))
             align_menu.addAction(action)
         
         align_button.setMenu(align_menu)
@@ -239,9 +257,12 @@ class MainToolbar(QToolBar):
         """Icon'u ayarlamaya çalış"""
         try:
             # Icon'ları resources klasöründe arıyor olacağız
-            icon_path = f"resources/icons/{icon_name}"
-            if os.path.exists(icon_path):
-                action.setIcon(QIcon(icon_path))
+            if icon_name in self._ICON_SET:
+                icon = self._ICON_CACHE.get(icon_name)
+                if icon is None:
+                    icon = QIcon(os.path.join(_ICON_DIR, icon_name))
+                    self._ICON_CACHE[icon_name] = icon
+                action.setIcon(icon)
             else:
                 # Varsayılan Qt icon'larını kullan
                 style = self.style()
@@ -278,22 +299,34 @@ class MainToolbar(QToolBar):
         if hasattr(self.parent_window, 'viewer') and self.parent_window.viewer:
             pass
     
+    def _emit_view_direction(self, direction: str, _checked: bool = False):
+        """Görünüm menüsü: yön sinyalini yay (triggered'ın checked argümanı yok sayılır)"""
+        self.view_direction_changed.emit(direction)
+    
     @pyqtSlot(str)
-    def _on_alignment_requested(self, align_type: str):
+    def _on_alignment_requested(self, align_type: str, _checked: bool = False):
         """Hizalama isteği"""
         self.logger.info(f"Hizalama isteği: {align_type}")
         # Ana pencerede hizalama fonksiyonu çağrılabilir
     
     @pyqtSlot(int)
     def _on_transparency_changed(self, value: int):
-        """Şeffaflık değişti"""
-        transparency = value / 100.0
+        """Şeffaflık değişti (16 ms'lik pencerede son değer uygulanır)"""
+        self._pending_transparency = value / 100.0
+        if not self._transparency_timer.isActive():
+            self._transparency_timer.start()
+    
+    @pyqtSlot()
+    def _apply_transparency(self):
+        """Bekleyen şeffaflığı seçili shape'lere tek seferde uygula"""
+        transparency = self._pending_transparency
+        self._pending_transparency = None
+        if transparency is None:
+            return
         
         if hasattr(self.parent_window, 'viewer') and self.parent_window.viewer:
-            # Seçili shape'lerin şeffaflığını değiştir
-            selected_shapes = self.parent_window.viewer.get_selected_shapes()
-            for shape_id in selected_shapes:
-                self.parent_window.viewer.set_shape_transparency(shape_id, transparency)
+            viewer = self.parent_window.viewer
+            viewer.set_transparency_batch(viewer.get_selected_shapes(), transparency)
     
     @pyqtSlot()
     def _on_help(self):
@@ -360,15 +393,15 @@ class ViewToolbar(QToolBar):
             shaded_btn = QPushButton("Shaded")
             shaded_btn.setCheckable(True)
             shaded_btn.setChecked(True)
-            shaded_btn.clicked.connect(lambda: self.view_mode_changed.emit("shaded"))
+            shaded_btn.clicked.connect(partial(self._emit_view_mode, "shaded"))
             
             wireframe_btn = QPushButton("Wireframe")
             wireframe_btn.setCheckable(True)
-            wireframe_btn.clicked.connect(lambda: self.view_mode_changed.emit("wireframe"))
+            wireframe_btn.clicked.connect(partial(self._emit_view_mode, "wireframe"))
             
             hidden_line_btn = QPushButton("Hidden Line")
             hidden_line_btn.setCheckable(True)
-            hidden_line_btn.clicked.connect(lambda: self.view_mode_changed.emit("hidden_line"))
+            hidden_line_btn.clicked.connect(partial(self._emit_view_mode, "hidden_line"))
             
             view_mode_group.addButton(shaded_btn, 0)
             view_mode_group.addButton(wireframe_btn, 1)
@@ -390,6 +423,10 @@ class ViewToolbar(QToolBar):
             
         except Exception as e:
             self.logger.error(f"View toolbar kurulum hatası: {e}")
+    
+    def _emit_view_mode(self, mode: str, _checked: bool = False):
+        """Görünüm modu sinyalini yay (clicked'in checked argümanı yok sayılır)"""
+        self.view_mode_changed.emit(mode)
 
 class AssemblyToolbar(QToolBar):
     """Montaj toolbar'ı"""
@@ -419,9 +456,7 @@ class AssemblyToolbar(QToolBar):
                 action = QAction(name, self)
                 action.setToolTip(tooltip)
                 action.setCheckable(True)
-                action.triggered.connect(
-                    lambda checked, ct=constraint_type: self._on_constraint_selected(ct, checked)
-                )
+                action.triggered.connect(partial(self._on_constraint_selected, constraint_type))
                 self.addAction(action)
             
             self.addSeparator()
@@ -474,6 +509,14 @@ class StatusToolbar(QToolBar):
         super().__init__("Durum Toolbar", parent)
         
         self.info_widgets = {}
+        
+        # Yüksek frekanslı güncellemeler ~15 Hz'e indirilir; sadece son değer yazılır
+        self._pending = {}
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(66)
+        self._flush_timer.timeout.connect(self._flush)
+        
         self._setup_toolbar()
     
     def _setup_toolbar(self):
@@ -507,13 +550,38 @@ class StatusToolbar(QToolBar):
     
     def update_mouse_coords(self, x: float, y: float, z: float):
         """Mouse koordinatlarını güncelle"""
-        self.mouse_coords.setText(f"X: {x:.2f}, Y: {y:.2f}, Z: {z:.2f}")
+        self._pending["mouse_coords"] = (x, y, z)
+        self._schedule_flush()
     
     def update_selection_info(self, selection_text: str):
         """Seçim bilgisini güncelle"""
-        self.selection_info.setText(selection_text)
+        self._pending["selection"] = selection_text
+        self._schedule_flush()
     
     def update_fps(self, fps: int):
         """FPS bilgisini güncelle"""
-        self.fps_label.setText(f"FPS: {fps}")
+        self._pending["fps"] = fps
+        self._schedule_flush()
+    
+    def _schedule_flush(self):
+        """Bekleyen bir yazma yoksa zamanlayıcıyı başlat"""
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    @pyqtSlot()
+    def _flush(self):
+        """Biriken son değerleri label'lara yaz (değişmeyenler atlanır)"""
+        pending, self._pending = self._pending, {}
+        
+        for key, value in pending.items():
+            if key == "mouse_coords":
+                text = _MOUSE_FMT % value
+            elif key == "fps":
+                text = _FPS_FMT % value
+            else:
+                text = value
+            
+            label = self.info_widgets[key]
+            if label.text() != text:
+                label.setText(text)
         
\ No newline at end of file
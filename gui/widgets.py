@@ -4,6 +4,8 @@ Property panel, log widget, progress widget vb.
 """
 
 import logging
+import threading
+from datetime import datetime
 from typing import Dict, Any, List, Optional
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QFormLayout,
@@ -11,10 +13,37 @@ from PyQt5.QtWidgets import (
     QScrollArea, QGroupBox, QSplitter, QTabWidget, QListWidget,
     QListWidgetItem, QFrame, QProgressBar, QPushButton, QComboBox,
     QSpinBox, QDoubleSpinBox, QCheckBox, QSlider, QTableWidget,
-    QTableWidgetItem, QHeaderView
+    QTableWidgetItem, QHeaderView, QListView, QAbstractItemView
 )
-from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QTimer
-from PyQt5.QtGui import QFont, QColor, QPalette
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QTimer, QSortFilterProxyModel, QRegExp, QMetaObject
+from PyQt5.QtGui import QFont, QColor, QPalette, QPixmap, QStandardItemModel, QStandardItem
+
+_MOUSE_FMT = "Mouse: %.1f, %.1f, %.1f"
+_FPS_FMT = "FPS: %d"
+_RGB_FMT = "RGB(%d, %d, %d)"
+
+def _flatten_properties(data: Dict[str, Any], prefix: str = "",
+                        out: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """Shape verisini nokta notasyonlu 'anahtar -> metin' sözlüğüne düzleştir"""
+    if out is None:
+        out = {}
+    
+    for key, value in data.items():
+        if str(key).startswith("_"):
+            continue  # iç kullanım alanları gösterilmez
+        
+        full_key = f"{prefix}{key}"
+        if isinstance(value, dict):
+            _flatten_properties(value, f"{full_key}.", out)
+        elif isinstance(value, float):
+            out[full_key] = f"{value:.3f}"
+        elif isinstance(value, (str, int, bool)) or value is None:
+            out[full_key] = "" if value is None else str(value)
+        elif isinstance(value, (list, tuple)):
+            out[full_key] = ", ".join(str(item) for item in value)
+        # OCC shape gibi diğer nesneler gösterilmez
+    
+    return out
 
 class PropertyPanel(QWidget):
     """Özellikler paneli widget'ı"""
@@ -26,7 +55,9 @@ class PropertyPanel(QWidget):
         
         self.logger = logging.getLogger("CADMontaj.PropertyPanel")
         self.current_shape_data = None
-        self.property_widgets = {}
+        self.property_widgets = {}  # property adı -> QLineEdit
+        self._last_props = {}  # son gösterilen property adı -> metin
+        self._pending = None  # panel gizliyken gelen son shape verisi
         
         self._setup_ui()
     
@@ -51,10 +82,75 @@ class PropertyPanel(QWidget):
         self.empty_label.setStyleSheet("color: gray; font-style: italic;")
         self.scroll_layout.addWidget(self.empty_label)
         
+        # Property satırları
+        self.form_layout = QFormLayout()
+        self.scroll_layout.addLayout(self.form_layout)
+        self.scroll_layout.addStretch()
+        
         self.scroll_area.setWidget(self.scroll_content)
         layout.addWidget(self.scroll_area)
         
         self.logger.debug("Property panel oluşturuldu")
+    
+    def update_properties(self, shape_data: Dict[str, Any]):
+        """Özellikleri güncelle (yalnızca değişen satırlar yeniden yazılır)"""
+        self.current_shape_data = shape_data
+        
+        # Gizliyken biçimlendirme yapma; gösterildiğinde uygulanır
+        if not self.isVisible():
+            self._pending = shape_data
+            return
+        
+        self._pending = None
+        try:
+            props = _flatten_properties(shape_data or {})
+            last_props = self._last_props
+            
+            self.setUpdatesEnabled(False)
+            try:
+                for key, text in props.items():
+                    widget = self.property_widgets.get(key)
+                    if widget is None:
+                        widget = QLineEdit(text)
+                        widget.setReadOnly(True)
+                        self.form_layout.addRow(f"{key}:", widget)
+                        self.property_widgets[key] = widget
+                        continue
+                    
+                    if key not in last_props:
+                        self._set_row_visible(widget, True)
+                    if last_props.get(key) != text:
+                        widget.setText(text)
+                
+                # Yeni veride olmayan satırları gizle (silme)
+                for key in last_props.keys() - props.keys():
+                    self._set_row_visible(self.property_widgets[key], False)
+                
+                self.empty_label.setVisible(not props)
+                self._last_props = props
+            finally:
+                self.setUpdatesEnabled(True)
+                
+        except Exception as e:
+            self.logger.error(f"Property güncelleme hatası: {e}")
+    
+    def clear_properties(self):
+        """Özellikleri temizle"""
+        self.update_properties({})
+        self.current_shape_data = None
+    
+    def showEvent(self, event):
+        """Gizliyken biriken güncellemeyi uygula"""
+        super().showEvent(event)
+        if self._pending is not None:
+            self.update_properties(self._pending)
+    
+    def _set_row_visible(self, widget: QLineEdit, visible: bool):
+        """Property satırını (etiket + alan) göster/gizle"""
+        widget.setVisible(visible)
+        label = self.form_layout.labelForField(widget)
+        if label is not None:
+            label.setVisible(visible)
 
 class GeometryInfoWidget(QWidget):
     """Geometri bilgi widget'ı"""
@@ -63,6 +159,8 @@ class GeometryInfoWidget(QWidget):
         super().__init__(parent)
         
         self.info_labels = {}
+        self._last_info = None  # son gösterilen değerler (değişmediyse label'lar yazılmaz)
+        self._pending = None  # widget gizliyken gelen son analiz verisi
         self._setup_ui()
     
     def _setup_ui(self):
@@ -99,36 +197,53 @@ class GeometryInfoWidget(QWidget):
     
     def update_geometry_info(self, analysis_data: Dict[str, Any]):
         """Geometri bilgilerini güncelle"""
+        # Gizliyken biçimlendirme yapma; gösterildiğinde uygulanır
+        if not self.isVisible():
+            self._pending = analysis_data
+            return
+        
+        self._pending = None
         try:
             basic_geom = analysis_data.get("basic_geometry", {})
-            
-            # Topology
             topology = basic_geom.get("topology", {})
-            self.info_labels["faces"].setText(str(topology.get("num_faces", 0)))
-            self.info_labels["edges"].setText(str(topology.get("num_edges", 0)))
-            self.info_labels["vertices"].setText(str(topology.get("num_vertices", 0)))
-            
-            # Properties
             properties = basic_geom.get("properties", {})
+            bbox = basic_geom.get("bounding_box", {})
             
             volume = properties.get("volume", 0)
+            surface_area = properties.get("surface_area", 0)
+            has_bbox = bool(bbox) and "width" in bbox
+            
+            info = (
+                topology.get("num_faces", 0),
+                topology.get("num_edges", 0),
+                topology.get("num_vertices", 0),
+                volume,
+                surface_area,
+                (bbox.get("width", 0), bbox.get("height", 0), bbox.get("depth", 0)) if has_bbox else None
+            )
+            if info == self._last_info:
+                return
+            self._last_info = info
+            
+            # Topology
+            self.info_labels["faces"].setText(str(info[0]))
+            self.info_labels["edges"].setText(str(info[1]))
+            self.info_labels["vertices"].setText(str(info[2]))
+            
+            # Properties
             if volume > 0:
                 self.info_labels["volume"].setText(f"{volume:.2f} mm³")
             else:
                 self.info_labels["volume"].setText("--")
             
-            surface_area = properties.get("surface_area", 0)
             if surface_area > 0:
                 self.info_labels["surface_area"].setText(f"{surface_area:.2f} mm²")
             else:
                 self.info_labels["surface_area"].setText("--")
             
             # Bounding box
-            bbox = basic_geom.get("bounding_box", {})
-            if bbox and "width" in bbox:
-                width = bbox.get("width", 0)
-                height = bbox.get("height", 0)
-                depth = bbox.get("depth", 0)
+            if has_bbox:
+                width, height, depth = info[5]
                 dimensions_text = f"{width:.1f}×{height:.1f}×{depth:.1f} mm"
                 self.info_labels["bbox_dimensions"].setText(dimensions_text)
             else:
@@ -139,8 +254,16 @@ class GeometryInfoWidget(QWidget):
     
     def clear_info(self):
         """Bilgileri temizle"""
+        self._last_info = None
+        self._pending = None
         for label in self.info_labels.values():
             label.setText("--")
+    
+    def showEvent(self, event):
+        """Gizliyken biriken güncellemeyi uygula"""
+        super().showEvent(event)
+        if self._pending is not None:
+            self.update_geometry_info(self._pending)
 
 class StatusInfoWidget(QWidget):
     """Durum bilgisi widget'ı"""
@@ -148,6 +271,19 @@ class StatusInfoWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         
+        # Mouse koordinatları ~30 Hz, FPS 2 Hz ile label'lara yazılır
+        self._pending_coords = None  # son (x, y, z)
+        self._coords_timer = QTimer(self)
+        self._coords_timer.setSingleShot(True)
+        self._coords_timer.setInterval(33)
+        self._coords_timer.timeout.connect(self._flush_coords)
+        
+        self._pending_fps = None
+        self._fps_timer = QTimer(self)
+        self._fps_timer.setSingleShot(True)
+        self._fps_timer.setInterval(500)
+        self._fps_timer.timeout.connect(self._flush_fps)
+        
         self._setup_ui()
     
     def _setup_ui(self):
@@ -188,8 +324,24 @@ class StatusInfoWidget(QWidget):
         layout.addWidget(self.fps_label)
     
     def update_mouse_coords(self, x: float, y: float, z: float = 0.0):
-        """Mouse koordinatlarını güncelle"""
-        self.mouse_coords_label.setText(f"Mouse: {x:.1f}, {y:.1f}, {z:.1f}")
+        """Mouse koordinatlarını güncelle (33 ms içindeki son değer yazılır)"""
+        self._pending_coords = (x, y, z)
+        
+        # Gizliyken timer kurulmaz; gösterildiğinde uygulanır
+        if self.isVisible() and not self._coords_timer.isActive():
+            self._coords_timer.start()
+    
+    @pyqtSlot()
+    def _flush_coords(self):
+        """Bekleyen mouse koordinatını label'a yaz"""
+        if self._pending_coords is not None:
+            self.mouse_coords_label.setText(_MOUSE_FMT % self._pending_coords)
+            self._pending_coords = None
+    
+    def showEvent(self, event):
+        """Gizliyken gelen son koordinatı uygula"""
+        super().showEvent(event)
+        self._flush_coords()
     
     def update_selection_info(self, selection_count: int):
         """Seçim bilgisini güncelle"""
@@ -205,8 +357,17 @@ class StatusInfoWidget(QWidget):
         self.zoom_label.setText(f"Zoom: {zoom_percent:.0f}%")
     
     def update_fps(self, fps: int):
-        """FPS'i güncelle"""
-        self.fps_label.setText(f"FPS: {fps}")
+        """FPS'i güncelle (saniyede en fazla iki kez yazılır)"""
+        self._pending_fps = fps
+        if not self._fps_timer.isActive():
+            self._fps_timer.start()
+    
+    @pyqtSlot()
+    def _flush_fps(self):
+        """Bekleyen FPS değerini label'a yaz"""
+        if self._pending_fps is not None:
+            self.fps_label.setText(_FPS_FMT % self._pending_fps)
+            self._pending_fps = None
 
 class ColorPickerWidget(QWidget):
     """Renk seçici widget'ı"""
@@ -224,10 +385,12 @@ class ColorPickerWidget(QWidget):
         layout = QHBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         
-        # Renk önizleme
+        # Renk önizleme (stylesheet yerine tek seferlik ayrılan pixmap doldurulur)
         self.color_preview = QLabel()
         self.color_preview.setFixedSize(30, 20)
-        self.color_preview.setStyleSheet(f"background-color: rgb({int(self.current_color[0]*255)}, {int(self.current_color[1]*255)}, {int(self.current_color[2]*255)}); border: 1px solid gray;")
+        self.color_preview.setFrameShape(QFrame.Box)
+        self._preview_pix = QPixmap(self.color_preview.contentsRect().size())
+        self._fill_preview(*(int(c * 255) for c in self.current_color))
         self.color_preview.mousePressEvent = self._open_color_dialog
         layout.addWidget(self.color_preview)
         
@@ -263,14 +426,17 @@ class ColorPickerWidget(QWidget):
     def set_color(self, color: tuple):
         """Rengi ayarla"""
         try:
+            if tuple(color) == tuple(self.current_color):
+                return  # aynı renk: widget'lar ve sinyal değişmez
+            
             self.current_color = color
             
             # Önizlemeyi güncelle
             r, g, b = [int(c * 255) for c in color]
-            self.color_preview.setStyleSheet(f"background-color: rgb({r}, {g}, {b}); border: 1px solid gray;")
+            self._fill_preview(r, g, b)
             
             # Label'ı güncelle
-            self.color_label.setText(f"RGB({r}, {g}, {b})")
+            self.color_label.setText(_RGB_FMT % (r, g, b))
             
             # Sinyal gönder
             self.color_changed.emit(color)
@@ -278,6 +444,11 @@ class ColorPickerWidget(QWidget):
         except Exception as e:
             logging.error(f"Renk ayarlama hatası: {e}")
     
+    def _fill_preview(self, r: int, g: int, b: int):
+        """Önizleme pixmap'ini verilen renkle doldur"""
+        self._preview_pix.fill(QColor(r, g, b))
+        self.color_preview.setPixmap(self._preview_pix)
+    
     def get_color(self) -> tuple:
         """Mevcut rengi al"""
         return self.current_color
@@ -365,6 +536,7 @@ class MaterialPropertyWidget(QWidget):
         
         layout.addStretch()
     
+    @pyqtSlot(str)
     def _apply_preset(self, preset_name: str):
         """Preset uygula"""
         presets = {
@@ -392,11 +564,13 @@ class MaterialPropertyWidget(QWidget):
             
             self.material_changed.emit(self.current_material)
     
+    @pyqtSlot(tuple)
     def _on_color_changed(self, color: tuple):
         """Renk değiştiğinde"""
         self.current_material["color"] = color
         self.material_changed.emit(self.current_material)
     
+    @pyqtSlot(int)
     def _on_transparency_changed(self, value: int):
         """Şeffaflık değiştiğinde"""
         transparency = value / 100.0
@@ -404,6 +578,7 @@ class MaterialPropertyWidget(QWidget):
         self.transparency_label.setText(f"{value}%")
         self.material_changed.emit(self.current_material)
     
+    @pyqtSlot(int)
     def _on_shininess_changed(self, value: int):
         """Parlaklık değiştiğinde"""
         shininess = value / 100.0
@@ -411,6 +586,7 @@ class MaterialPropertyWidget(QWidget):
         self.shininess_label.setText(f"{value}%")
         self.material_changed.emit(self.current_material)
     
+    @pyqtSlot(bool)
     def _on_metallic_changed(self, metallic: bool):
         """Metalik özellik değiştiğinde"""
         self.current_material["metallic"] = metallic
@@ -437,24 +613,54 @@ class MaterialPropertyWidget(QWidget):
 class LogWidget(QWidget):
     """Log mesajları widget'ı"""
     
+    # Seviye renkleri ve öncelikleri sınıf tanımında bir kez oluşturulur
+    _LEVEL_COLORS: Dict[str, QColor] = {
+        "DEBUG": QColor(128, 128, 128),    # Gri
+        "INFO": QColor(0, 0, 0),           # Siyah
+        "WARNING": QColor(255, 140, 0),    # Turuncu
+        "ERROR": QColor(255, 0, 0),        # Kırmızı
+        "CRITICAL": QColor(139, 0, 0)      # Koyu kırmızı
+    }
+    _LEVEL_PRIORITY: Dict[str, int] = {
+        "DEBUG": 0,
+        "INFO": 1,
+        "WARNING": 2,
+        "ERROR": 3,
+        "CRITICAL": 4
+    }
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         
         self.max_log_entries = 1000
+        
+        # Gelen girdiler biriktirilir, timer tick'inde tek seferde eklenir
+        self._pending: List[tuple] = []  # (level, message, timestamp)
+        self._pending_lock = threading.Lock()  # worker thread'lerden de eklenebilir
+        
         self._setup_ui()
         
-        # Log handler bağlantısı için timer
-        self.update_timer = QTimer()
+        # Bekleyen girdi varken bir kez çalışır (boşta event loop'u uyandırmaz)
+        self.update_timer = QTimer(self)
+        self.update_timer.setSingleShot(True)
+        self.update_timer.setInterval(100)
         self.update_timer.timeout.connect(self._update_logs)
-        self.update_timer.start(1000)  # Her saniye güncelle
     
     def _setup_ui(self):
         """UI'yi kur"""
         layout = QVBoxLayout(self)
         layout.setContentsMargins(5, 5, 5, 5)
         
-        # Log listesi
-        self.log_list = QListWidget()
+        # Log listesi (model + seviye filtresi proxy'si)
+        self._log_model = QStandardItemModel(self)
+        self._proxy = QSortFilterProxyModel(self)
+        self._proxy.setSourceModel(self._log_model)
+        self._proxy.setFilterRole(Qt.UserRole)  # satırın seviye önceliği (int)
+        
+        self.log_list = QListView()
+        self.log_list.setModel(self._proxy)
+        self.log_list.setUniformItemSizes(True)
+        self.log_list.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.log_list.setAlternatingRowColors(True)
         layout.addWidget(self.log_list)
         
@@ -479,73 +685,84 @@ class LogWidget(QWidget):
         layout.addLayout(controls_layout)
     
     def add_log_entry(self, level: str, message: str, timestamp: str = None):
-        """Log girdisi ekle"""
+        """Log girdisi ekle (widget'a bir sonraki timer tick'inde yazılır)"""
+        if not timestamp:
+            now = datetime.now()
+            timestamp = f"{now.hour:02d}:{now.minute:02d}:{now.second:02d}"
+        
+        with self._pending_lock:
+            was_empty = not self._pending
+            self._pending.append((level, message, timestamp))
+        
+        # Tampon boşken gelen ilk girdi timer'ı kurar; worker thread'den
+        # çağrılabileceği için başlatma GUI thread'ine kuyruklanır
+        if was_empty:
+            QMetaObject.invokeMethod(self.update_timer, "start", Qt.QueuedConnection)
+    
+    @pyqtSlot()
+    def _update_logs(self):
+        """Biriken log girdilerini listeye tek seferde ekle"""
+        with self._pending_lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, []
+        
+        # Sınırın dışında kalacak girdiler hiç oluşturulmaz
+        pending = pending[-self.max_log_entries:]
+        
+        # Toplu ekleme sırasında alternatif satır boyaması da kapatılır
+        self.log_list.setUpdatesEnabled(False)
+        self.log_list.setAlternatingRowColors(False)
         try:
-            if not timestamp:
-                from datetime import datetime
-                timestamp = datetime.now().strftime("%H:%M:%S")
-            
-            # Renk belirleme
-            colors = {
-                "DEBUG": QColor(128, 128, 128),    # Gri
-                "INFO": QColor(0, 0, 0),           # Siyah
-                "WARNING": QColor(255, 140, 0),    # Turuncu
-                "ERROR": QColor(255, 0, 0),        # Kırmızı
-                "CRITICAL": QColor(139, 0, 0)      # Koyu kırmızı
-            }
+            colors = self._LEVEL_COLORS
+            priorities = self._LEVEL_PRIORITY
             
-            # Mesaj formatla
-            formatted_message = f"[{timestamp}] [{level}] {message}"
-            
-            # Liste öğesi oluştur
-            item = QListWidgetItem(formatted_message)
-            item.setData(Qt.UserRole, level)  # Level'i sakla
-            
-            # Rengi ayarla
-            if level in colors:
-                item.setForeground(colors[level])
-            
-            self.log_list.addItem(item)
+            for level, message, timestamp in pending:
+                # Mesaj formatla
+                formatted_message = f"[{timestamp}] [{level}] {message}"
+                
+                # Liste öğesi oluştur
+                item = QStandardItem(formatted_message)
+                item.setData(priorities.get(level, 0), Qt.UserRole)  # Level önceliğini sakla
+                
+                # Rengi ayarla
+                color = colors.get(level)
+                if color is not None:
+                    item.setForeground(color)
+                
+                self._log_model.appendRow(item)
             
             # Maksimum giriş sınırı
-            if self.log_list.count() > self.max_log_entries:
-                self.log_list.takeItem(0)
-            
-            # En son eklenen öğeye kaydır
-            self.log_list.scrollToBottom()
+            overflow = self._log_model.rowCount() - self.max_log_entries
+            if overflow > 0:
+                self._log_model.removeRows(0, overflow)
             
         except Exception as e:
             print(f"Log ekleme hatası: {e}")
+        finally:
+            self.log_list.setAlternatingRowColors(True)
+            self.log_list.setUpdatesEnabled(True)
+        
+        # En son eklenen öğeye kaydır
+        self.log_list.scrollToBottom()
     
-    def _update_logs(self):
-        """Log'ları güncelle (gerçek log handler'dan)"""
-        # Bu fonksiyon log handler ile entegre edilebilir
-        # Şimdilik boş bırakıyoruz
-        pass
-    
+    @pyqtSlot(str)
     def _filter_by_level(self, level: str):
         """Seviyeye göre filtrele"""
-        level_priority = {
-            "DEBUG": 0,
-            "INFO": 1,
-            "WARNING": 2,
-            "ERROR": 3,
-            "CRITICAL": 4
-        }
-        
-        min_priority = level_priority.get(level, 0)
+        min_priority = self._LEVEL_PRIORITY.get(level, 0)
+        max_priority = max(self._LEVEL_PRIORITY.values())
         
-        for i in range(self.log_list.count()):
-            item = self.log_list.item(i)
-            item_level = item.data(Qt.UserRole)
-            item_priority = level_priority.get(item_level, 0)
-            
-            # Seçili seviye ve üzerindeki mesajları göster
-            item.setHidden(item_priority < min_priority)
+        # Seçili seviye ve üzerindeki mesajları göster (eşleştirme Qt tarafında yapılır)
+        self._proxy.setFilterRegExp(QRegExp(f"^[{min_priority}-{max_priority}]$"))
     
     def clear_logs(self):
         """Tüm log'ları temizle"""
-        self.log_list.clear()
+        # Henüz yazılmamış girdiler de atılır (worker thread'ler ekliyor olabilir)
+        with self._pending_lock:
+            self._pending.clear()
+        self.update_timer.stop()
+        
+        self._log_model.removeRows(0, self._log_model.rowCount())
 
 class ProgressWidget(QWidget):
     """Progress gösterimi widget'ı"""
@@ -555,6 +772,13 @@ class ProgressWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         
+        # Progress güncellemeleri ~25 Hz ile widget'a yansıtılır
+        self._pending_value: Optional[int] = None
+        self._pending_message: Optional[str] = None
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush_progress)
+        
         self._setup_ui()
         self.setVisible(False)
     
@@ -583,6 +807,11 @@ class ProgressWidget(QWidget):
     
     def start_operation(self, message: str, indeterminate: bool = False):
         """İşlem başlat"""
+        # Önceki işlemden kalan güncellemeler atılır
+        self._flush_timer.stop()
+        self._pending_value = None
+        self._pending_message = None
+        
         self.message_label.setText(message)
         
         if indeterminate:
@@ -594,14 +823,29 @@ class ProgressWidget(QWidget):
         self.setVisible(True)
     
     def update_progress(self, value: int, message: str = None):
-        """Progress güncelle"""
-        self.progress_bar.setValue(value)
-        
+        """Progress güncelle (40 ms içindeki güncellemelerden sonuncusu uygulanır)"""
+        self._pending_value = value
         if message:
-            self.message_label.setText(message)
+            self._pending_message = message
+        
+        if not self._flush_timer.isActive():
+            self._flush_timer.start(40)
+    
+    @pyqtSlot()
+    def _flush_progress(self):
+        """Bekleyen progress değerini ve mesajı widget'lara yaz"""
+        if self._pending_value is not None:
+            self.progress_bar.setValue(self._pending_value)
+            self._pending_value = None
+        
+        if self._pending_message is not None:
+            self.message_label.setText(self._pending_message)
+            self._pending_message = None
     
     def finish_operation(self):
         """İşlem bitir"""
+        self._flush_timer.stop()
+        self._flush_progress()
         self.setVisible(False)
 
 class ShapeTreeWidget(QTreeWidget):
@@ -613,6 +857,12 @@ class ShapeTreeWidget(QTreeWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         
+        # Art arda eklemelerden sonra ağaç bir kez genişletilir
+        self._expand_timer = QTimer(self)
+        self._expand_timer.setSingleShot(True)
+        self._expand_timer.setInterval(0)
+        self._expand_timer.timeout.connect(self._do_expand)
+        
         self._setup_ui()
         self._setup_connections()
     
@@ -637,11 +887,12 @@ class ShapeTreeWidget(QTreeWidget):
     
     def add_shape(self, shape_id: str, shape_data: Dict[str, Any]):
         """Shape ekle"""
+        self.setUpdatesEnabled(False)
         try:
             metadata = shape_data.get("metadata", {})
             
-            # Ana öğe
-            item = QTreeWidgetItem(self)
+            # Ana öğe ağaca eklenmeden doldurulur (kurulum sırasında itemChanged tetiklenmez)
+            item = QTreeWidgetItem()
             
             # Shape adı
             file_name = metadata.get("file_name", f"Shape {shape_id}")
@@ -664,10 +915,18 @@ class ShapeTreeWidget(QTreeWidget):
             # Analiz verilerini alt öğeler olarak ekle
             self._add_analysis_children(item, shape_data.get("analysis", {}))
             
-            self.expandAll()
+            self.addTopLevelItem(item)
             
         except Exception as e:
             logging.error(f"Shape ağaca ekleme hatası: {e}")
+        finally:
+            self.setUpdatesEnabled(True)
+            self._expand_timer.start()
+    
+    @pyqtSlot()
+    def _do_expand(self):
+        """Bekleyen genişletmeyi uygula"""
+        self.expandAll()
     
     def _add_analysis_children(self, parent_item: QTreeWidgetItem, analysis: Dict[str, Any]):
         """Analiz verilerini alt öğe olarak ekle"""
@@ -717,6 +976,7 @@ class ShapeTreeWidget(QTreeWidget):
         """Tüm shape'leri temizle"""
         self.clear()
     
+    @pyqtSlot()
     def _on_selection_changed(self):
         """Seçim değiştiğinde"""
         selected_items = self.selectedItems()
@@ -727,6 +987,7 @@ class ShapeTreeWidget(QTreeWidget):
                 self.shape_selected.emit(shape_id)
                 break
     
+    @pyqtSlot(QTreeWidgetItem, int)
     def _on_item_changed(self, item: QTreeWidgetItem, column: int):
         """Öğe değiştiğinde (checkbox)"""
         if column == 0:  # İsim kolonu
@@ -792,30 +1053,47 @@ class AssemblyConstraintWidget(QWidget):
     
     def add_constraint(self, constraint_data: Dict[str, Any]):
         """Kısıtlama ekle"""
+        self.add_constraints([constraint_data])
+    
+    def add_constraints(self, items: List[Dict[str, Any]]):
+        """Kısıtlamaları toplu ekle (tablo tek seferde büyütülür ve yeniden çizilir)"""
+        if not items:
+            return
+        
+        table = self.constraint_table
+        sorting = table.isSortingEnabled()
+        table.setUpdatesEnabled(False)
+        table.setSortingEnabled(False)
         try:
-            constraint_id = f"constraint_{len(self.constraints)}"
-            self.constraints[constraint_id] = constraint_data
-            
-            # Tabloya ekle
-            row = self.constraint_table.rowCount()
-            self.constraint_table.insertRow(row)
-            
-            # Veri doldur
-            constraint_type = constraint_data.get("type", "Unknown")
-            part1 = constraint_data.get("part1", "")
-            part2 = constraint_data.get("part2", "")
-            value = constraint_data.get("value", "")
+            # Satırlar önceden ayrılır
+            base = table.rowCount()
+            table.setRowCount(base + len(items))
             
-            self.constraint_table.setItem(row, 0, QTableWidgetItem(constraint_type))
-            self.constraint_table.setItem(row, 1, QTableWidgetItem(str(part1)))
-            self.constraint_table.setItem(row, 2, QTableWidgetItem(str(part2)))
-            self.constraint_table.setItem(row, 3, QTableWidgetItem(str(value)))
-            
-            # ID'yi sakla
-            self.constraint_table.item(row, 0).setData(Qt.UserRole, constraint_id)
+            for offset, constraint_data in enumerate(items):
+                row = base + offset
+                constraint_id = f"constraint_{len(self.constraints)}"
+                self.constraints[constraint_id] = constraint_data
+                
+                # Veri doldur
+                constraint_type = constraint_data.get("type", "Unknown")
+                part1 = constraint_data.get("part1", "")
+                part2 = constraint_data.get("part2", "")
+                value = constraint_data.get("value", "")
+                
+                # ID'yi tür hücresinde sakla
+                type_item = QTableWidgetItem(constraint_type)
+                type_item.setData(Qt.UserRole, constraint_id)
+                
+                table.setItem(row, 0, type_item)
+                table.setItem(row, 1, QTableWidgetItem(str(part1)))
+                table.setItem(row, 2, QTableWidgetItem(str(part2)))
+                table.setItem(row, 3, QTableWidgetItem(str(value)))
             
         except Exception as e:
             logging.error(f"Kısıtlama ekleme hatası: {e}")
+        finally:
+            table.setSortingEnabled(sorting)
+            table.setUpdatesEnabled(True)
     
     def _add_constraint(self):
         """Yeni kısıtlama ekle"""
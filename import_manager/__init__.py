@@ -30,17 +30,33 @@ def create_geometry_analyzer(config=None):
     return GeometryAnalyzer(config)
 
 # Convenience function - tek fonksiyonla import
-def import_cad_file(file_path: str, config=None):
+def import_cad_file(file_path: str, config=None, progress_cb=None, cancel_cb=None):
     """
     CAD dosyasını içe aktar (validation + import + analysis)
     
     Args:
         file_path: CAD dosya yolu
         config: Konfigürasyon
+        progress_cb: Aşama ilerlemesi için çağrılır (0-100 arası int)
+        cancel_cb: True dönerse aşamalar arasında işlem iptal edilir
         
     Returns:
         (shape, metadata, analysis) tuple'ı
     """
+    def report(value: int):
+        if progress_cb is not None:
+            progress_cb(value)
+    
+    def cancelled() -> bool:
+        return cancel_cb is not None and cancel_cb()
+    
+    cancelled_metadata = {
+        "file_path": file_path,
+        "error": "İçe aktarma iptal edildi",
+        "import_successful": False,
+        "cancelled": True
+    }
+    
     try:
         # Validator
         validator = create_file_validator(config)
@@ -49,6 +65,10 @@ def import_cad_file(file_path: str, config=None):
         if not is_valid:
             return None, validation_info, None
         
+        report(20)
+        if cancelled():
+            return None, cancelled_metadata, None
+        
         # Importer
         importer = create_step_importer(config)
         shape, metadata = importer.import_cad_file(file_path)
@@ -56,10 +76,18 @@ def import_cad_file(file_path: str, config=None):
         if shape is None:
             return None, metadata, None
         
+        report(60)
+        if cancelled():
+            return None, cancelled_metadata, None
+        
         # Analyzer
         analyzer = create_geometry_analyzer(config)
         analysis = analyzer.analyze_imported_shape(shape, file_path)
         
+        report(90)
+        if cancelled():
+            return None, cancelled_metadata, None
+        
         # Metadata'ya validation bilgilerini ekle
         metadata["validation"] = validation_info
         
@@ -7,6 +7,7 @@ from .assembly_engine import AssemblyEngine, AssemblyResult, AssemblyStatus
 from .collision_detector import CollisionDetector, CollisionInfo, CollisionType
 from .alignment_tools import AlignmentTools, AlignmentType
 from .connection_finder import ConnectionFinder, ConnectionType
+from .broad_phase import AABBTree, conservative_aabb, overlapping_pairs, pairs_from_hits
 
 __version__ = "1.0.0"
 __author__ = "CAD Developer"
@@ -22,7 +23,11 @@ __all__ = [
     'AlignmentTools',
     'AlignmentType', 
     'ConnectionFinder',
-    'ConnectionType'
+    'ConnectionType',
+    'AABBTree',
+    'conservative_aabb',
+    'overlapping_pairs',
+    'pairs_from_hits'
 ]
 
 def create_assembly_engine(config=None):
@@ -0,0 +1,339 @@
+"""
+Geniş Faz (Broad Phase) Çakışma Ön Elemesi
+Bounding box'ları kesişmeyen parça çiftlerini pahalı dar faz kontrolünden önce eler
+"""
+
+from itertools import compress
+from typing import Any, List, Optional, Sequence
+
+import numpy as np
+
+try:
+    # İsteğe bağlı: karşılaştırmaları tek geçişte (SIMD döngü birleştirme) değerlendirir
+    import numexpr
+except ImportError:
+    numexpr = None
+
+try:
+    # İsteğe bağlı: çift taramasını derlenmiş, çok çekirdekli döngüde yapar
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+_OVERLAP_EXPR = (
+    "(lx <= hx_t) & (hx >= lx_t) & "
+    "(ly <= hy_t) & (hy >= ly_t) & "
+    "(lz <= hz_t) & (hz >= lz_t)"
+)
+
+def overlapping_pairs(boxes: Sequence[Sequence[float]], margin: float = 0.0) -> np.ndarray:
+    """
+    Bounding box'ları kesişen (i, j), i < j çiftlerini vektörel olarak bul
+
+    Her eksen için altı karşılaştırmalı AABB testi (sqrt/çarpma yok) tüm
+    N×N matris üzerinde tek seferde yapılır. Kutular float32'ye dışa doğru
+    yuvarlanır; sonuç yalnızca geniş faz içindir, dar faz OCC'nin double
+    hassasiyetini kullanmaya devam eder.
+
+    Args:
+        boxes: (xmin, ymin, zmin, xmax, ymax, zmax) satırları
+        margin: Kutuları her yönde genişletme payı (dokunma toleransı)
+
+    Returns:
+        (K, 2) boyutlu aday çift indeksleri
+    """
+    boxes = np.asarray(boxes, dtype=float).reshape(-1, 6)
+    count = len(boxes)
+    if count < 2:
+        return np.empty((0, 2), dtype=np.intp)
+
+    # Eksen başına ayrı, bitişik float32 diziler (SoA)
+    low = [_round_out(boxes[:, axis] - margin, -np.inf) for axis in range(3)]
+    high = [_round_out(boxes[:, axis + 3] + margin, np.inf) for axis in range(3)]
+
+    if njit is not None:
+        return _overlapping_pairs_jit(np.stack(low), np.stack(high))
+
+    return np.argwhere(np.triu(_overlap_mask(low, high), k=1))
+
+def conservative_aabb(box: Sequence[float]) -> tuple:
+    """
+    AABB'yi float32'de tam gösterilebilen, dışa yuvarlanmış tuple'a çevir
+
+    Geniş faz önbelleği içindir; sonuç asıl kutuyu her zaman kapsar.
+    """
+    box = np.asarray(box, dtype=float).reshape(6)
+    low = _round_out(box[:3], -np.inf)
+    high = _round_out(box[3:], np.inf)
+    return tuple(float(v) for v in np.concatenate((low, high)))
+
+def pairs_from_hits(hits: Sequence[Sequence[int]]) -> np.ndarray:
+    """
+    Satır başına aday listelerinden (K, 2) çift dizisi oluştur
+
+    İki geçişli: önce her satırın aday sayısı alınır, kümülatif toplamdan
+    yazma ofsetleri çıkarılır ve çıktı tek seferde ayrılır; ikinci geçişte
+    her satır kendi dilimine doğrudan yazılır (büyüyen liste yok).
+
+    Args:
+        hits: hits[i], i ile eşleşen parça indeksleri
+
+    Returns:
+        (i, j) satırlarından oluşan dizi
+    """
+    counts = np.fromiter((len(row) for row in hits), dtype=np.intp, count=len(hits))
+    offsets = np.cumsum(counts) - counts
+    pairs = np.empty((int(counts.sum()), 2), dtype=np.intp)
+
+    for i, row in enumerate(hits):
+        if row:
+            start = offsets[i]
+            end = start + counts[i]
+            pairs[start:end, 0] = i
+            pairs[start:end, 1] = row
+
+    return pairs
+
+def _round_out(values: np.ndarray, direction: float) -> np.ndarray:
+    """float32'ye çevir ve bir ulp dışa kaydır (kutu asla küçülmez)"""
+    values = np.ascontiguousarray(values, dtype=np.float32)
+    return np.nextafter(values, np.float32(direction))
+
+def _overlap_mask(low: List[np.ndarray], high: List[np.ndarray]) -> np.ndarray:
+    """Eksen dizilerinden N×N kesişim maskesi (numexpr varsa tek birleşik döngü)"""
+    if numexpr is not None:
+        variables = {}
+        for axis, name in enumerate("xyz"):
+            variables[f"l{name}"] = low[axis][:, None]
+            variables[f"h{name}"] = high[axis][:, None]
+            variables[f"l{name}_t"] = low[axis][None, :]
+            variables[f"h{name}_t"] = high[axis][None, :]
+        return numexpr.evaluate(_OVERLAP_EXPR, local_dict=variables)
+
+    count = len(low[0])
+    overlap = np.ones((count, count), dtype=bool)
+    for axis in range(3):
+        overlap &= low[axis][:, None] <= high[axis][None, :]
+        overlap &= high[axis][:, None] >= low[axis][None, :]
+    return overlap
+
+if njit is not None:
+    @njit(inline="always")
+    def _boxes_overlap(lo, hi, i, j):
+        return (lo[0, i] <= hi[0, j] and hi[0, i] >= lo[0, j] and
+                lo[1, i] <= hi[1, j] and hi[1, i] >= lo[1, j] and
+                lo[2, i] <= hi[2, j] and hi[2, i] >= lo[2, j])
+
+    @njit(parallel=True, cache=True)
+    def _broadphase_count(lo, hi, counts):
+        """Her i satırı için j > i kesişim sayısı (satırlar bağımsız, kilit yok)"""
+        count = lo.shape[1]
+        for i in prange(count):
+            hits = 0
+            for j in range(i + 1, count):
+                if _boxes_overlap(lo, hi, i, j):
+                    hits += 1
+            counts[i] = hits
+
+    @njit(parallel=True, cache=True)
+    def _broadphase_write(lo, hi, offsets, pairs):
+        """Her satır kendi ofsetinden itibaren çiftlerini yazar"""
+        count = lo.shape[1]
+        for i in prange(count):
+            k = offsets[i]
+            for j in range(i + 1, count):
+                if _boxes_overlap(lo, hi, i, j):
+                    pairs[k, 0] = i
+                    pairs[k, 1] = j
+                    k += 1
+
+def _overlapping_pairs_jit(lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+    """(3, N) alt/üst sınırlardan aday çiftler (Numba, önce say sonra yaz)"""
+    counts = np.zeros(lo.shape[1], dtype=np.intp)
+    _broadphase_count(lo, hi, counts)
+
+    offsets = np.cumsum(counts) - counts
+    pairs = np.empty((int(counts.sum()), 2), dtype=np.intp)
+    _broadphase_write(lo, hi, offsets, pairs)
+    return pairs
+
+def _union(a: tuple, b: tuple) -> tuple:
+    """İki AABB'yi kapsayan kutu"""
+    return (min(a[0], b[0]), min(a[1], b[1]), min(a[2], b[2]),
+            max(a[3], b[3]), max(a[4], b[4]), max(a[5], b[5]))
+
+def _area(box: tuple) -> float:
+    """AABB yüzey alanı (ekleme maliyeti sezgiseli için)"""
+    dx, dy, dz = box[3] - box[0], box[4] - box[1], box[5] - box[2]
+    return 2.0 * (dx * dy + dy * dz + dz * dx)
+
+class _AABBNode:
+    """AABB ağacı düğümü"""
+
+    __slots__ = ("box", "parent", "left", "right", "key")
+
+    def __init__(self, box: tuple, key=None, parent=None):
+        self.box = box
+        self.key = key  # sadece yapraklarda dolu
+        self.parent = parent
+        self.left = None
+        self.right = None
+
+    @property
+    def is_leaf(self) -> bool:
+        return self.left is None
+
+class AABBTree:
+    """
+    Dinamik AABB ağacı (BVH)
+
+    Parçalar eklenirken/çıkarılırken güncellenir; query() bir kutuyla kesişen
+    parçaları tüm çiftleri gezmeden, ortalama O(log n) düğüm ziyaretiyle bulur.
+    """
+
+    def __init__(self):
+        self._root = None
+        self._leaves = {}  # key -> yaprak düğüm
+
+    def __len__(self) -> int:
+        return len(self._leaves)
+
+    def __contains__(self, key) -> bool:
+        return key in self._leaves
+
+    def insert(self, key, box: Sequence[float]):
+        """Parçayı ağaca ekle (varsa kutusunu güncelle)"""
+        if key in self._leaves:
+            self.remove(key)
+
+        leaf = _AABBNode(tuple(float(v) for v in box), key)
+        self._leaves[key] = leaf
+
+        if self._root is None:
+            self._root = leaf
+            return
+
+        # Yüzey alanı artışı en az olan kardeşi bul
+        node = self._root
+        while not node.is_leaf:
+            left_cost = _area(_union(node.left.box, leaf.box)) - _area(node.left.box)
+            right_cost = _area(_union(node.right.box, leaf.box)) - _area(node.right.box)
+            node = node.left if left_cost <= right_cost else node.right
+
+        # Kardeş ile yeni yaprağı ortak bir ebeveyn altına al
+        old_parent = node.parent
+        parent = _AABBNode(_union(node.box, leaf.box), parent=old_parent)
+        parent.left, parent.right = node, leaf
+        node.parent = leaf.parent = parent
+
+        if old_parent is None:
+            self._root = parent
+        elif old_parent.left is node:
+            old_parent.left = parent
+        else:
+            old_parent.right = parent
+
+        self._refit(old_parent)
+
+    def remove(self, key) -> bool:
+        """Parçayı ağaçtan çıkar"""
+        leaf = self._leaves.pop(key, None)
+        if leaf is None:
+            return False
+
+        parent = leaf.parent
+        if parent is None:
+            self._root = None
+            return True
+
+        # Kardeş, ebeveynin yerine geçer
+        sibling = parent.right if parent.left is leaf else parent.left
+        grandparent = parent.parent
+        sibling.parent = grandparent
+
+        if grandparent is None:
+            self._root = sibling
+        else:
+            if grandparent.left is parent:
+                grandparent.left = sibling
+            else:
+                grandparent.right = sibling
+            self._refit(grandparent)
+
+        return True
+
+    def clear(self):
+        """Ağacı boşalt"""
+        self._root = None
+        self._leaves.clear()
+
+    def query(self, box: Sequence[float], margin: float = 0.0) -> List[Any]:
+        """Verilen kutuyla (margin kadar genişletilmiş) kesişen parça anahtarları"""
+        if self._root is None:
+            return []
+
+        xmin, ymin, zmin = box[0] - margin, box[1] - margin, box[2] - margin
+        xmax, ymax, zmax = box[3] + margin, box[4] + margin, box[5] + margin
+
+        result = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            b = node.box
+            if (b[0] > xmax or b[3] < xmin or
+                    b[1] > ymax or b[4] < ymin or
+                    b[2] > zmax or b[5] < zmin):
+                continue
+
+            if node.is_leaf:
+                result.append(node.key)
+            else:
+                stack.append(node.left)
+                stack.append(node.right)
+
+        return result
+
+    def query_batch(self, boxes: Sequence[Sequence[float]], margin: float = 0.0) -> List[List[Any]]:
+        """
+        Birden fazla kutuyu aynı anda sorgula
+
+        Ağaç seviye seviye gezilir: her adımda tüm canlı (sorgu, düğüm)
+        çiftlerinin kutuları tek diziye toplanır ve kesişim tek vektörel
+        karşılaştırmayla yapılır. Sonuç query() ile aynıdır.
+
+        Returns:
+            Her sorgu kutusu için kesişen parça anahtarları
+        """
+        boxes = np.asarray(boxes, dtype=float).reshape(-1, 6)
+        results = [[] for _ in range(len(boxes))]
+        if self._root is None or not len(boxes):
+            return results
+
+        low = boxes[:, :3] - margin
+        high = boxes[:, 3:] + margin
+
+        query_ids = np.arange(len(boxes))
+        nodes = [self._root] * len(boxes)
+        while nodes:
+            node_boxes = np.array([node.box for node in nodes], dtype=float)
+            hit = ((node_boxes[:, :3] <= high[query_ids]) &
+                   (node_boxes[:, 3:] >= low[query_ids])).all(axis=1)
+
+            next_ids, next_nodes = [], []
+            for query_id, node in zip(query_ids[hit].tolist(), compress(nodes, hit)):
+                if node.is_leaf:
+                    results[query_id].append(node.key)
+                else:
+                    next_ids += (query_id, query_id)
+                    next_nodes += (node.left, node.right)
+
+            query_ids = np.array(next_ids, dtype=np.intp)
+            nodes = next_nodes
+
+        return results
+
+    def _refit(self, node: Optional[_AABBNode]):
+        """Düğümden köke kadar kapsayan kutuları güncelle"""
+        while node is not None:
+            node.box = _union(node.left.box, node.right.box)
+            node = node.parent
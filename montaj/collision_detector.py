@@ -4,6 +4,7 @@ CAD parçaları arasındaki çakışmaları tespit eden sistem
 """
 
 import logging
+import threading
 import time
 from typing import Dict, Any, List, Tuple, Optional, Set
 from enum import Enum
@@ -42,6 +43,7 @@ try:
     # Shape exploration & tools
     from OCC.Core.BRep import BRep_Tool
     from OCC.Core.TopExp import TopExp_Explorer
+    from OCC.Core.TopTools import TopTools_ListOfShape
 
     # Topology utilities
     from OCC.Extend.TopologyUtils import TopologyExplorer
@@ -53,6 +55,7 @@ except ImportError as e:
     raise
 
 from utils.constants import AssemblyDefaults
+from .broad_phase import overlapping_pairs
 
 class CollisionType(Enum):
     """Çakışma türleri"""
@@ -113,6 +116,9 @@ class CollisionDetector:
         self.bounding_box_cache = {}
         self.collision_cache = {}
         
+        # Dar faz birden çok thread'den çağrılır; sayaç ve cache erişimleri bu kilitle yapılır
+        self._lock = threading.Lock()
+        
         # İstatistikler
         self.collision_checks = 0
         self.cache_hits = 0
@@ -154,7 +160,8 @@ class CollisionDetector:
             CollisionInfo objesi
         """
         start_time = time.time()
-        self.collision_checks += 1
+        with self._lock:
+            self.collision_checks += 1
         
         collision_info = CollisionInfo()
         
@@ -168,9 +175,13 @@ class CollisionDetector:
             
             # Cache kontrolü
             cache_key = self._generate_cache_key(shape1, shape2)
-            if cache_key in self.collision_cache and not detailed:
-                self.cache_hits += 1
-                return self.collision_cache[cache_key].copy()
+            if not detailed:
+                with self._lock:
+                    cached = self.collision_cache.get(cache_key)
+                    if cached is not None:
+                        self.cache_hits += 1
+                if cached is not None:
+                    return cached.copy()
             
             # Bounding box ön kontrolü
             if self.use_bounding_box_precheck:
@@ -200,11 +211,12 @@ class CollisionDetector:
                 collision_info = self._perform_detailed_analysis(shape1, shape2, collision_info)
             
             collision_info.analysis_time = time.time() - start_time
-            self.total_analysis_time += collision_info.analysis_time
-            
-            # Cache'e ekle
-            if not detailed:
-                self.collision_cache[cache_key] = collision_info
+            with self._lock:
+                self.total_analysis_time += collision_info.analysis_time
+                
+                # Cache'e ekle
+                if not detailed:
+                    self.collision_cache[cache_key] = collision_info
             
             self.logger.debug(f"Çakışma analizi tamamlandı: {collision_info.collision_type.value}")
             return collision_info
@@ -224,21 +236,40 @@ class CollisionDetector:
             shapes: [(shape_id, shape), ...] listesi
             
         Returns:
-            {(shape_id1, shape_id2): CollisionInfo, ...}
+            {(shape_id1, shape_id2): CollisionInfo, ...} - bounding box'ları
+            kesişmeyen (geniş fazda elenen) çiftler sonuçta yer almaz
         """
         results = {}
         
         try:
             self.logger.info(f"Toplu çakışma kontrolü başlatılıyor: {len(shapes)} parça")
             
-            # Tüm parça çiftlerini kontrol et
-            for i in range(len(shapes)):
-                for j in range(i + 1, len(shapes)):
-                    id1, shape1 = shapes[i]
-                    id2, shape2 = shapes[j]
-                    
-                    collision_info = self.analyze_collision(shape1, shape2, detailed=False)
-                    results[(id1, id2)] = collision_info
+            # Geniş faz: bounding box'ı bilinen parçalar vektörel olarak elenir
+            known, unknown, boxes = [], [], []
+            for index, (_, shape) in enumerate(shapes):
+                bbox = self._get_bounding_box(shape)
+                if bbox.IsVoid():
+                    unknown.append(index)
+                else:
+                    known.append(index)
+                    boxes.append(bbox.Get())
+            
+            candidate_pairs = [(known[a], known[b])
+                               for a, b in overlapping_pairs(boxes, self.touch_tolerance)]
+            
+            # Bounding box'ı olmayan parçalar herkesle kontrol edilir
+            unknown_set = set(unknown)
+            for i in unknown:
+                candidate_pairs.extend((min(i, j), max(i, j)) for j in range(len(shapes))
+                                       if j != i and (j not in unknown_set or j > i))
+            
+            # Dar faz: sadece aday çiftler
+            for i, j in candidate_pairs:
+                id1, shape1 = shapes[i]
+                id2, shape2 = shapes[j]
+                
+                collision_info = self.analyze_collision(shape1, shape2, detailed=False)
+                results[(id1, id2)] = collision_info
             
             # İstatistikleri logla
             collision_count = sum(1 for info in results.values() 
@@ -297,23 +328,36 @@ class CollisionDetector:
             self.logger.warning(f"Bounding box kesişim kontrolü hatası: {e}")
             return True  # Güvenli taraf
     
+    def get_aabb(self, shape: TopoDS_Shape) -> Optional[Tuple[float, ...]]:
+        """Shape'in (xmin, ymin, zmin, xmax, ymax, zmax) kutusu (boşsa None)"""
+        bbox = self._get_bounding_box(shape)
+        if bbox.IsVoid():
+            return None
+        return tuple(bbox.Get())
+    
+    def forget_shape(self, shape: TopoDS_Shape):
+        """Kaldırılan shape'in önbellekteki bounding box'ını sil"""
+        with self._lock:
+            self.bounding_box_cache.pop(id(shape), None)
+    
     def _get_bounding_box(self, shape: TopoDS_Shape) -> Bnd_Box:
         """Shape'in bounding box'ını al"""
         try:
             shape_id = id(shape)
             
             # Cache kontrol
-            if shape_id in self.bounding_box_cache:
-                return self.bounding_box_cache[shape_id]
+            with self._lock:
+                bbox = self.bounding_box_cache.get(shape_id)
+            if bbox is not None:
+                return bbox
             
-            # Bounding box hesapla
+            # Bounding box kilit dışında hesaplanır (shape yalnızca okunur)
             bbox = Bnd_Box()
             brepbndlib.Add(shape, bbox)
             
-            # Cache'e ekle
-            self.bounding_box_cache[shape_id] = bbox
-            
-            return bbox
+            # Cache'e ekle (aynı anda hesaplayan thread varsa ilk yazılan kullanılır)
+            with self._lock:
+                return self.bounding_box_cache.setdefault(shape_id, bbox)
             
         except Exception as e:
             self.logger.warning(f"Bounding box hesaplama hatası: {e}")
@@ -409,8 +453,19 @@ class CollisionDetector:
     def _analyze_overlap(self, shape1: TopoDS_Shape, shape2: TopoDS_Shape, collision_info: CollisionInfo) -> CollisionInfo:
         """Çakışma analizi yap"""
         try:
-            # Boolean intersection ile çakışma geometrisini bul
-            common_op = BRepAlgoAPI_Common(shape1, shape2)
+            # Boolean intersection ile çakışma geometrisini bul. Girdi shape'leri
+            # thread'ler arasında paylaşıldığından tolerans güncellemeleri girdiye
+            # yazılmaz (non-destructive mod: gerekirse kopya üzerinde çalışılır)
+            arguments = TopTools_ListOfShape()
+            arguments.Append(shape1)
+            tools = TopTools_ListOfShape()
+            tools.Append(shape2)
+            
+            common_op = BRepAlgoAPI_Common()
+            common_op.SetArguments(arguments)
+            common_op.SetTools(tools)
+            common_op.SetNonDestructive(True)
+            common_op.Build()
             
             if common_op.IsDone():
                 common_shape = common_op.Shape()
@@ -521,8 +576,9 @@ class CollisionDetector:
     
     def clear_cache(self):
         """Cache'i temizle"""
-        self.collision_cache.clear()
-        self.bounding_box_cache.clear()
+        with self._lock:
+            self.collision_cache.clear()
+            self.bounding_box_cache.clear()
         self.logger.debug("Collision cache temizlendi")
     
     def set_tolerance(self, tolerance: float):
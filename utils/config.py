@@ -11,6 +11,7 @@ class Config:
     
     def __init__(self, config_file: str = "config.json"):
         self.config_file = config_file
+        self._flat_cache = None  # nokta notasyonlu düz görünüm
         self.settings = self._load_default_settings()
         self._load_config()
     
@@ -159,6 +160,7 @@ class Config:
         
         # Son anahtarı güncelle
         current[keys[-1]] = value
+        self._flat_cache = None
     
     def save(self):
         """Konfigürasyonu dosyaya kaydet"""
@@ -202,13 +204,32 @@ class Config:
     def reset_to_defaults(self):
         """Ayarları varsayılana sıfırla"""
         self.settings = self._load_default_settings()
+        self._flat_cache = None
         self.save()
     
     def get_all_settings(self) -> Dict[str, Any]:
         """Tüm ayarları al"""
         return self.settings.copy()
     
+    def as_flat(self) -> Dict[str, Any]:
+        """Tüm ayarları nokta notasyonlu düz dictionary olarak al (önbellekli)"""
+        if self._flat_cache is None:
+            flat = {}
+            self._flatten(self.settings, "", flat)
+            self._flat_cache = flat
+        return self._flat_cache
+    
+    def _flatten(self, settings: Dict[str, Any], prefix: str, flat: Dict[str, Any]):
+        """İç içe ayarları düzleştir"""
+        for key, value in settings.items():
+            full_key = f"{prefix}{key}"
+            if isinstance(value, dict):
+                self._flatten(value, f"{full_key}.", flat)
+            else:
+                flat[full_key] = value
+    
     def update_settings(self, settings: Dict[str, Any]):
         """Toplu ayar güncelleme"""
         self._merge_configs(self.settings, settings)
+        self._flat_cache = None
         self.save()
\ No newline at end of file